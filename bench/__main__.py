@@ -0,0 +1,43 @@
+import argparse
+import sys
+
+from bench.suite import (ALLOCATIONS_PATH, BASELINE_PATH, compare, format_report, load_baseline, run_suite,
+                         save_baseline, split_counts)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog="python -m bench")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 400, 1000])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--allocations", default=ALLOCATIONS_PATH)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--save", action="store_true")
+    arguments = parser.parse_args()
+
+    metrics = run_suite(arguments.sizes, arguments.frames)
+    timings, counts = split_counts(metrics)
+    baseline = load_baseline(arguments.baseline)
+    allocations = load_baseline(arguments.allocations)
+    expected = dict(baseline or {})
+    expected.update(allocations or {})
+    print(format_report(metrics, expected))
+
+    if arguments.save:
+        save_baseline(timings, arguments.baseline)
+        save_baseline(counts, arguments.allocations)
+        print("Saved baselines to " + arguments.baseline + " and " + arguments.allocations)
+        sys.exit(0)
+
+    if allocations is None:
+        print("No allocation baseline at " + arguments.allocations + ", run with --save to record one",
+              file=sys.stderr)
+        sys.exit(1)
+    if baseline is None:
+        print("No timing baseline at " + arguments.baseline + ", only allocation counts were checked")
+
+    regressions = compare(metrics, expected, arguments.threshold)
+    if regressions:
+        print("\nPerformance regressions over %.0f%%:" % (arguments.threshold * 100), file=sys.stderr)
+        for name, before, value in regressions:
+            print("  %s: %g -> %g" % (name, before, value), file=sys.stderr)
+        sys.exit(1)
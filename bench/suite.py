@@ -0,0 +1,278 @@
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from types import FrameType
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from core.rect import Rect
+from core.size import Size
+from core.vector2d import Vector2D
+from engine.animation import Animation
+from engine.gameobject import GameObject
+from engine.physics import ContactCache, PhysicsState
+from engine.spatial import SpatialIndex
+from game.batch import RandomInput
+from game.game import Game
+from game.objects.frame import Frame
+from game.objects.layer import Layer
+from game.scenario import Scenario
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+ALLOCATIONS_PATH = os.path.join(os.path.dirname(__file__), "allocations.json")
+COUNT_SUFFIXES = ("_allocated_blocks", "_constructed_objects")
+
+Metrics = Dict[str, float]
+
+SLACK = {
+    "_bytes": 1024,
+    "_blocks": 1,
+    "_objects": 1,
+}
+
+
+def measure(function: Callable[[], object], number: int, repeat: int = 5) -> float:
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            best = min(best, (time.perf_counter() - start) / number)
+    finally:
+        gc.enable()
+    return best
+
+
+def allocated_blocks() -> int:
+    snapshot = tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+    return sum(stat.count for stat in snapshot.statistics("filename"))
+
+
+class ConstructorCounter(object):
+    count: int
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def profile(self, frame: FrameType, event: str, _) -> None:
+        if event == "call" and frame.f_code.co_name == "__init__":
+            self.count += 1
+
+
+def count_allocations(function: Callable[[], object], number: int) -> Tuple[float, float, float]:
+    peak = 0
+    blocks = 0
+    constructors = ConstructorCounter()
+    tracemalloc.start()
+    gc.disable()
+    try:
+        function()
+        for _ in range(number):
+            tracemalloc.clear_traces()
+            sys.setprofile(constructors.profile)
+            function()
+            sys.setprofile(None)
+            blocks += allocated_blocks()
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+    finally:
+        sys.setprofile(None)
+        gc.enable()
+        tracemalloc.stop()
+    return peak, blocks / number, constructors.count / number
+
+
+def record_allocations(metrics: Metrics, name: str, function: Callable[[], object], number: int) -> None:
+    peak, blocks, constructed = count_allocations(function, number)
+    metrics[name + "_peak_bytes"] = peak
+    metrics[name + "_allocated_blocks"] = blocks
+    metrics[name + "_constructed_objects"] = constructed
+
+
+def resting_position(game: Game) -> Vector2D:
+    world = game.world
+    frame = next(child for child in world.children if isinstance(child, Frame))
+    floor_left, floor_top, floor_right, _ = SpatialIndex.bounds(frame.floor.physics)
+    size = game.player.frame.size
+    x = floor_left + frame.width + size.width / 2
+    while x < floor_right - frame.width - size.width / 2:
+        region = Rect.make(x, floor_top - size.height / 2, size.width, size.height)
+        if not world.query_region(region, Layer.CONSUMABLE):
+            break
+        x += size.width
+    return Vector2D(x, floor_top - size.height / 2 + game.player.physics.gravityForce)
+
+
+def bench_vector2d(metrics: Metrics) -> None:
+    a = Vector2D(1.5, -2.5)
+    b = Vector2D(0.25, 4)
+    metrics["vector2d.add"] = measure(lambda: a + b, 100000)
+    metrics["vector2d.sub"] = measure(lambda: a - b, 100000)
+    metrics["vector2d.mul"] = measure(lambda: a * 0.5, 100000)
+    metrics["vector2d.copy"] = measure(a.copy, 100000)
+
+
+def bench_animation(metrics: Metrics) -> None:
+    animation = Animation(80)
+    for _ in range(6):
+        animation.add_frame(None)
+    metrics["animation.animate"] = measure(animation.animate, 100000)
+
+
+def bench_contacts(metrics: Metrics, size: int) -> None:
+    pairs: List[Tuple[PhysicsState, PhysicsState]] = list()
+    for index in range(size):
+        moving = GameObject(None, Rect.make(index * 20, 0, 10, 10))
+        moving.physics = PhysicsState(moving)
+        moving.physics.still = False
+        resting = GameObject(None, Rect.make(index * 20, 9.9, 10, 10))
+        resting.physics = PhysicsState(resting)
+        pairs.append((moving.physics, resting.physics))
+    contacts = ContactCache()
+
+    def detect_collision() -> None:
+        contacts.begin_tick()
+        for first, second in pairs:
+            first.detect_collision(second, contacts)
+        contacts.end_tick()
+
+    prefix = "contacts%d." % size
+    metrics[prefix + "detect_collision"] = measure(detect_collision, 20)
+    record_allocations(metrics, prefix + "detect_collision", detect_collision, 20)
+
+
+def bench_scene(metrics: Metrics, size: int, frames: int) -> None:
+    game = Game(Scenario(count=size, power_count=size // 2, seed=0), headless=True)
+    prefix = "scene%d." % size
+    try:
+        world = game.world
+        bodies: List[PhysicsState] = list()
+        world.collect_colliders(bodies)
+        objects: List[GameObject] = [body.game_object for body in bodies]
+        player = game.player.physics
+        contacts = ContactCache()
+        others = [body for body in bodies if body is not player]
+        keyboard = RandomInput(size)
+        rest = resting_position(game)
+
+        def place_player() -> None:
+            game.player.frame.center.x = rest.x
+            game.player.frame.center.y = rest.y
+            player.velocity.x = 0
+            player.velocity.y = 0
+
+        def detect_collision() -> None:
+            place_player()
+            contacts.begin_tick()
+            for body in others:
+                player.detect_collision(body, contacts)
+            contacts.end_tick()
+
+        def detect_collisions() -> None:
+            place_player()
+            world.detect_collisions(game.contacts)
+
+        def global_position() -> None:
+            for game_object in objects:
+                game_object.global_position()
+
+        def frame() -> None:
+            game.step(keyboard.next())
+            game.render()
+
+        def render() -> None:
+            world.render(game.worldView)
+            game.context.fills.flush(game.context.renderer)
+
+        game.worldView.update(game.context.settings, world.camera.global_position(), world.camera.frame.size)
+        metrics[prefix + "detect_collision"] = measure(detect_collision, 20)
+        metrics[prefix + "detect_collisions"] = measure(detect_collisions, 5)
+        metrics[prefix + "global_position"] = measure(global_position, 20)
+        metrics[prefix + "render"] = measure(render, 20)
+        metrics[prefix + "animate"] = measure(world.animate, 20)
+        metrics[prefix + "region_query"] = measure(
+            lambda: world.query_region(Rect(Vector2D(), Size(100, 100))), 100)
+        metrics[prefix + "raycast"] = measure(
+            lambda: world.raycast(Vector2D(), Vector2D(1, 1), 300), 100)
+        metrics[prefix + "frame"] = measure(frame, 20)
+        record_allocations(metrics, prefix + "detect_collision", detect_collision, 20)
+        record_allocations(metrics, prefix + "detect_collisions", detect_collisions, 5)
+
+        place_player()
+        for _ in range(10):
+            frame()
+        record_allocations(metrics, prefix + "frame", frame, frames)
+    finally:
+        game.exit()
+
+
+def run_suite(sizes: Sequence[int], frames: int = 60) -> Metrics:
+    metrics: Metrics = dict()
+    bench_vector2d(metrics)
+    bench_animation(metrics)
+    for size in sizes:
+        bench_contacts(metrics, size)
+        bench_scene(metrics, size, frames)
+    return metrics
+
+
+def load_baseline(path: str = BASELINE_PATH) -> Metrics | None:
+    if not os.path.exists(path):
+        return None
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_baseline(metrics: Metrics, path: str = BASELINE_PATH) -> None:
+    with open(path, "w") as file:
+        json.dump(metrics, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def split_counts(metrics: Metrics) -> Tuple[Metrics, Metrics]:
+    timings: Metrics = dict()
+    counts: Metrics = dict()
+    for name, value in metrics.items():
+        if name.endswith(COUNT_SUFFIXES):
+            counts[name] = value
+        else:
+            timings[name] = value
+    return timings, counts
+
+
+def compare(metrics: Metrics, baseline: Metrics, threshold: float) -> List[Tuple[str, float, float]]:
+    regressions = list()
+    for name, value in metrics.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        slack = next((slack for suffix, slack in SLACK.items() if name.endswith(suffix)), 0)
+        if value > expected * (1 + threshold) + slack:
+            regressions.append((name, expected, value))
+    return regressions
+
+
+def format_value(name: str, value: float) -> str:
+    if name.endswith("_bytes"):
+        return "%.0f B" % value
+    if name.endswith("_blocks") or name.endswith("_objects"):
+        return "%.1f" % value
+    return "%.3f us" % (value * 1e6)
+
+
+def format_report(metrics: Metrics, baseline: Metrics | None) -> str:
+    rows = [("benchmark", "value", "baseline", "change")]
+    for name, value in metrics.items():
+        expected = baseline.get(name) if baseline else None
+        if expected:
+            change = "%+.1f%%" % ((value / expected - 1) * 100)
+        else:
+            change = "-"
+        rows.append((name, format_value(name, value),
+                     format_value(name, expected) if expected is not None else "-", change))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join("  ".join(cell.ljust(width) if i == 0 else cell.rjust(width)
+                               for i, (cell, width) in enumerate(zip(row, widths))) for row in rows)
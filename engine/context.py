@@ -1,16 +1,19 @@
 import sdl2
 
+from engine.fill import FillBatch
 from engine.settings import GameSettings
 
 
 class GameContext(object):
     renderer: sdl2.SDL_Renderer
     settings: GameSettings
+    fills: FillBatch
     quit: bool = False
 
     def __init__(self, renderer: sdl2.SDL_Renderer, settings: GameSettings) -> None:
         self.renderer = renderer
         self.settings = settings
+        self.fills = FillBatch()
         if not self.renderer:
             raise RuntimeError("Renderer could not be created. SDL Error: "
                                + str(sdl2.SDL_GetError()))
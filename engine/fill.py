@@ -0,0 +1,36 @@
+import ctypes
+from typing import Dict, List, Tuple
+
+import sdl2
+
+FillColor = Tuple[int, int, int, int]
+FillRect = Tuple[float, float, float, float]
+
+
+class FillBatch(object):
+    groups: Dict[FillColor, List[FillRect]]
+    buffer: ctypes.Array
+
+    def __init__(self) -> None:
+        self.groups = dict()
+        self.buffer = (sdl2.SDL_FRect * 64)()
+
+    def add(self, color: FillColor, rect: FillRect) -> None:
+        group = self.groups.get(color)
+        if group is None:
+            group = self.groups[color] = list()
+        group.append(rect)
+
+    def flush(self, renderer: sdl2.SDL_Renderer) -> None:
+        if not self.groups:
+            return
+        sdl2.SDL_SetRenderDrawBlendMode(renderer, sdl2.SDL_BLENDMODE_BLEND)
+        for (r, g, b, a), rects in self.groups.items():
+            if len(rects) > len(self.buffer):
+                self.buffer = (sdl2.SDL_FRect * (len(rects) * 2))()
+            for i in range(len(rects)):
+                rect = self.buffer[i]
+                rect.x, rect.y, rect.w, rect.h = rects[i]
+            sdl2.SDL_SetRenderDrawColor(renderer, r, g, b, a)
+            sdl2.SDL_RenderFillRectsF(renderer, self.buffer, len(rects))
+        self.groups.clear()
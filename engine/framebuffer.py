@@ -0,0 +1,37 @@
+import ctypes
+
+import numpy
+import sdl2
+
+
+class Framebuffer(object):
+    width: int
+    height: int
+    surface: sdl2.SDL_Surface
+    renderer: sdl2.SDL_Renderer
+    pixels: numpy.ndarray | None
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.surface = sdl2.SDL_CreateRGBSurfaceWithFormat(0, width, height, 32, sdl2.SDL_PIXELFORMAT_RGBA32)
+        if not self.surface:
+            raise RuntimeError("Surface could not be created. SDL Error: "
+                               + str(sdl2.SDL_GetError()))
+        self.renderer = sdl2.SDL_CreateSoftwareRenderer(self.surface)
+        if not self.renderer:
+            raise RuntimeError("Software renderer could not be created. SDL Error: "
+                               + str(sdl2.SDL_GetError()))
+
+        surface = self.surface.contents
+        buffer = ctypes.cast(surface.pixels, ctypes.POINTER(ctypes.c_uint8 * (surface.pitch * height))).contents
+        self.pixels = numpy.ndarray(
+            (height, width, 4),
+            dtype=numpy.uint8,
+            buffer=buffer,
+            strides=(surface.pitch, 4, 1))
+
+    def destroy(self) -> None:
+        self.pixels = None
+        sdl2.SDL_DestroyRenderer(self.renderer)
+        sdl2.SDL_FreeSurface(self.surface)
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-from typing import Set, List
+from typing import Dict, Set, List, Tuple
 
 import sdl2
 
+import engine.pool
 from core.rect import Rect
-from core.size import Size
 from core.vector2d import Vector2D
 from engine.animation import Animation
 from engine.context import GameContext
-from engine.physics import PhysicsState, Collision
-from engine.render import RenderObject
+from engine.physics import PhysicsState, Collision, ContactCache
+from engine.render import RenderObject, DrawCommand, ViewTransform
 
 
 class GameObject(object):
@@ -22,7 +22,9 @@ class GameObject(object):
     visible: bool
     removed: bool
     parent: GameObject | None
+    pool: engine.pool.ObjectPool | None
     context: GameContext
+    poolable: bool = False
 
     def __init__(self, context: GameContext, frame: Rect) -> None:
         self.children = set()
@@ -33,8 +35,27 @@ class GameObject(object):
         self.visible = True
         self.removed = False
         self.parent = None
+        self.pool = None
         self.context = context
 
+    def reset(self, frame: Rect) -> None:
+        self.frame.center.x = frame.center.x
+        self.frame.center.y = frame.center.y
+        self.frame.size.width = frame.size.width
+        self.frame.size.height = frame.size.height
+        self.renderObject = None
+        self.animation = None
+        for child in self.children:
+            child.parent = None
+            if child.pool:
+                child.pool.release(child)
+        self.children.clear()
+        self.visible = True
+        self.removed = False
+        self.parent = None
+        if self.physics:
+            self.physics.reset()
+
     def handle_event(self, e: sdl2.SDL_Event) -> None:
         for child in self.children:
             child.handle_event(e)
@@ -50,12 +71,30 @@ class GameObject(object):
         for child in self.children:
             child.process_physics()
 
-    def detect_collisions(self) -> None:
+    def detect_collisions(self, contacts: ContactCache) -> None:
         collected_colliders: List[PhysicsState] = list()
         self.collect_colliders(collected_colliders)
-        for i in range(len(collected_colliders)):
-            for j in range(i + 1, len(collected_colliders)):
-                collected_colliders[i].detect_collision(collected_colliders[j])
+        contacts.begin_tick()
+        for collider in collected_colliders:
+            if not collider.still:
+                collider.sweep(collected_colliders)
+
+        groups: Dict[Tuple[int, int], List[PhysicsState]] = dict()
+        for collider in collected_colliders:
+            groups.setdefault((collider.layer, collider.mask), list()).append(collider)
+        group_list = list(groups.values())
+        for g in range(len(group_list)):
+            group = group_list[g]
+            if group[0].accepts(group[0]):
+                for i in range(len(group)):
+                    for j in range(i + 1, len(group)):
+                        group[i].detect_collision(group[j], contacts)
+            for other_group in group_list[g + 1:]:
+                if group[0].accepts(other_group[0]):
+                    for collider in group:
+                        for other_collider in other_group:
+                            collider.detect_collision(other_collider, contacts)
+        contacts.end_tick()
 
     def collect_colliders(self, collected_colliders: List[PhysicsState]) -> None:
         if self.physics:
@@ -80,12 +119,36 @@ class GameObject(object):
         for child in self.children:
             child.animate()
 
-    def render(self, local_basis: Vector2D, camera_position: Vector2D, camera_size: Size) -> None:
-        global_position = self.frame.center + local_basis
+    def render(self, view: ViewTransform, basis_x: float = 0, basis_y: float = 0) -> None:
+        x = self.frame.center.x + basis_x
+        y = self.frame.center.y + basis_y
+        if self.visible and self.renderObject:
+            self.renderObject.render(self.context, view, x, y, self.frame.size)
+        for child in self.children:
+            child.render(view, x, y)
+
+    def collect_draws(
+            self,
+            view: ViewTransform,
+            draws: List[DrawCommand],
+            basis_x: float = 0,
+            basis_y: float = 0
+    ) -> None:
+        x = self.frame.center.x + basis_x
+        y = self.frame.center.y + basis_y
         if self.visible and self.renderObject:
-            self.renderObject.render(self.context, global_position, self.frame.size, camera_position, camera_size)
+            draws.append(self.renderObject.draw_command(view, x, y, self.frame.size))
         for child in self.children:
-            child.render(global_position, camera_position, camera_size)
+            child.collect_draws(view, draws, x, y)
+
+    def mark_dirty(self) -> None:
+        if self.parent:
+            self.parent.mark_dirty()
+
+    def set_visible(self, visible: bool) -> None:
+        if self.visible != visible:
+            self.visible = visible
+            self.mark_dirty()
 
     def add_child(self, child) -> None:
         self.children.add(child)
@@ -95,6 +158,8 @@ class GameObject(object):
         for child in self.children.copy():
             if child.removed:
                 self.children.remove(child)
+                if child.pool:
+                    child.pool.release(child)
 
     def global_position(self) -> Vector2D:
         if self.parent:
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import math
+from typing import List
+
+import numpy
+
+from core.color import Color
+from core.rect import Rect
+from core.vector2d import Vector2D
+from engine.context import GameContext
+from engine.gameobject import GameObject
+from engine.render import DrawCommand, GeometryCommand, ViewTransform
+
+
+class ParticleEmitter(GameObject):
+    capacity: int
+    count: int
+    gravity: float
+    particleSize: float
+    positions: numpy.ndarray
+    velocities: numpy.ndarray
+    life: numpy.ndarray
+    colors: numpy.ndarray
+    vertices: numpy.ndarray
+    vertexColors: numpy.ndarray
+    indices: numpy.ndarray
+    geometry: GeometryCommand
+    rng: numpy.random.Generator
+
+    def __init__(self, context: GameContext, frame: Rect, capacity: int = 1024, seed: int | None = None) -> None:
+        super().__init__(context, frame)
+        self.capacity = capacity
+        self.count = 0
+        self.gravity = 0
+        self.particleSize = 1
+        self.positions = numpy.zeros((capacity, 2), dtype=numpy.float32)
+        self.velocities = numpy.zeros((capacity, 2), dtype=numpy.float32)
+        self.life = numpy.zeros(capacity, dtype=numpy.int32)
+        self.colors = numpy.zeros((capacity, 4), dtype=numpy.uint8)
+        self.vertices = numpy.zeros((capacity, 4, 2), dtype=numpy.float32)
+        self.vertexColors = numpy.zeros((capacity, 4, 4), dtype=numpy.uint8)
+        quad = numpy.array([0, 1, 2, 0, 2, 3], dtype=numpy.int32)
+        self.indices = (numpy.arange(capacity, dtype=numpy.int32)[:, None] * 4 + quad).ravel()
+        self.geometry = GeometryCommand(self.vertices, self.vertexColors, self.indices, 0)
+        self.rng = numpy.random.default_rng(seed)
+
+    def emit(
+            self,
+            count: int,
+            speed: float,
+            life: int,
+            color: Color,
+            origin: Vector2D | None = None
+    ) -> None:
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        emitted = slice(self.count, self.count + count)
+        origin = origin or self.global_position()
+        angles = self.rng.uniform(0, 2 * math.pi, count)
+        speeds = self.rng.uniform(0, speed, count)
+        self.positions[emitted] = (origin.x, origin.y)
+        self.velocities[emitted, 0] = numpy.cos(angles) * speeds
+        self.velocities[emitted, 1] = numpy.sin(angles) * speeds
+        self.life[emitted] = self.rng.integers(life // 2 + 1, life + 1, count)
+        self.colors[emitted] = (color.r, color.g, color.b, color.a)
+        self.count += count
+
+    def process_physics(self) -> None:
+        super().process_physics()
+        if not self.count:
+            return
+        count = self.count
+        self.velocities[:count, 1] += self.gravity
+        self.positions[:count] += self.velocities[:count]
+        self.life[:count] -= 1
+        alive = self.life[:count] > 0
+        if not alive.all():
+            self.count = int(alive.sum())
+            self.positions[:self.count] = self.positions[:count][alive]
+            self.velocities[:self.count] = self.velocities[:count][alive]
+            self.life[:self.count] = self.life[:count][alive]
+            self.colors[:self.count] = self.colors[:count][alive]
+
+    def build_vertices(self, view: ViewTransform) -> None:
+        count = self.count
+        half = self.particleSize / 2
+        left = (self.positions[:count, 0] - half) * view.scaleX + view.offsetX
+        top = (self.positions[:count, 1] - half) * view.scaleY + view.offsetY
+        right = left + self.particleSize * view.scaleX
+        bottom = top + self.particleSize * view.scaleY
+        vertices = self.vertices[:count]
+        vertices[:, 0, 0] = left
+        vertices[:, 0, 1] = top
+        vertices[:, 1, 0] = right
+        vertices[:, 1, 1] = top
+        vertices[:, 2, 0] = right
+        vertices[:, 2, 1] = bottom
+        vertices[:, 3, 0] = left
+        vertices[:, 3, 1] = bottom
+        self.vertexColors[:count] = self.colors[:count, None, :]
+
+    def render(self, view: ViewTransform, basis_x: float = 0, basis_y: float = 0) -> None:
+        super().render(view, basis_x, basis_y)
+        if not self.visible or not self.count:
+            return
+        self.build_vertices(view)
+        self.geometry.count = self.count
+        self.geometry.submit(self.context.renderer)
+
+    def collect_draws(
+            self,
+            view: ViewTransform,
+            draws: List[DrawCommand],
+            basis_x: float = 0,
+            basis_y: float = 0
+    ) -> None:
+        super().collect_draws(view, draws, basis_x, basis_y)
+        if not self.visible or not self.count:
+            return
+        self.build_vertices(view)
+        draws.append(GeometryCommand(
+            self.vertices[:self.count].copy(),
+            self.vertexColors[:self.count].copy(),
+            self.indices,
+            self.count))
@@ -1,34 +1,117 @@
 from __future__ import annotations
 
-from typing import Set
+import math
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
 
-import engine.gameobject
 from core.vector2d import Vector2D
 
+if TYPE_CHECKING:
+    import engine.gameobject
+
 
 class PhysicsState(object):
     velocity: Vector2D
+    displacement: Vector2D
     gravity: bool
     still: bool
     gravityForce: float
-    colliders: Set[engine.gameobject.GameObject]
+    contactSkin: float = 0.01
+    contactCount: int
+    layer: int = 1
+    mask: int = 0xffffffff
+    blocking: bool = True
     game_object: engine.gameobject.GameObject
 
     def __init__(self, game_object: engine.gameobject.GameObject) -> None:
         self.velocity = Vector2D()
+        self.displacement = Vector2D()
         self.gravity = False
         self.still = True
         self.gravityForce = 0
-        self.colliders = set()
+        self.contactCount = 0
         self.game_object = game_object
 
+    def reset(self) -> None:
+        self.velocity.x = 0
+        self.velocity.y = 0
+        self.displacement.x = 0
+        self.displacement.y = 0
+        self.contactCount = 0
+
     def change(self) -> None:
         if self.gravity:
             self.velocity.y += self.gravityForce
+        self.displacement.x = self.velocity.x
+        self.displacement.y = self.velocity.y
         self.game_object.frame.center.x += self.velocity.x
         self.game_object.frame.center.y += self.velocity.y
 
-    def detect_collision(self, collider: PhysicsState) -> None:
+    def accepts(self, collider: PhysicsState) -> bool:
+        return bool(self.mask & collider.layer and collider.mask & self.layer)
+
+    @staticmethod
+    def sweep_axis(start: float, delta: float, extent: float) -> Tuple[float, float]:
+        if delta:
+            near = (-extent - start) / delta
+            far = (extent - start) / delta
+            return (near, far) if near < far else (far, near)
+        if -extent < start < extent:
+            return -math.inf, math.inf
+        return math.inf, -math.inf
+
+    def time_of_impact(self, collider: PhysicsState) -> Tuple[float, float, bool] | None:
+        dx = self.displacement.x - collider.displacement.x
+        dy = self.displacement.y - collider.displacement.y
+        if not dx and not dy:
+            return None
+
+        self_position = self.game_object.global_position()
+        collider_position = collider.game_object.global_position()
+        self_size = self.game_object.frame.size
+        collider_size = collider.game_object.frame.size
+
+        entry_x, exit_x = self.sweep_axis(
+            self_position.x - dx - collider_position.x,
+            dx,
+            (self_size.width + collider_size.width) / 2)
+        entry_y, exit_y = self.sweep_axis(
+            self_position.y - dy - collider_position.y,
+            dy,
+            (self_size.height + collider_size.height) / 2)
+
+        entry = max(entry_x, entry_y)
+        exit_time = min(exit_x, exit_y)
+        if entry >= exit_time or entry < 0 or entry > 1:
+            return None
+        return entry, exit_time, entry_x >= entry_y
+
+    def sweep(self, colliders: List[PhysicsState]) -> None:
+        impact: Tuple[float, float, bool] | None = None
+        impact_collider: PhysicsState | None = None
+        for collider in colliders:
+            if collider is self or not collider.blocking or not self.accepts(collider):
+                continue
+            time_of_impact = self.time_of_impact(collider)
+            if time_of_impact and (not impact or time_of_impact[0] < impact[0]):
+                impact = time_of_impact
+                impact_collider = collider
+
+        if not impact:
+            return
+
+        entry, _, x_axis = impact
+        dx = self.displacement.x - impact_collider.displacement.x
+        dy = self.displacement.y - impact_collider.displacement.y
+        rewind = 1 - entry
+        center = self.game_object.frame.center
+        if x_axis:
+            center.x -= dx * rewind
+            center.x += math.copysign(min(self.contactSkin, abs(dx) * rewind), dx)
+        else:
+            center.y -= dy * rewind
+            center.y += math.copysign(min(self.contactSkin, abs(dy) * rewind), dy)
+
+    def detect_collision(self, collider: PhysicsState, contacts: ContactCache) -> None:
         if self.still and collider.still:
             return
 
@@ -50,31 +133,139 @@ class PhysicsState(object):
               - self_size.height / 2 \
               - (collider_position.y + collider_size.height / 2)
 
-        already_collided = self.colliders.__contains__(collider.game_object) \
-                           or collider.colliders.__contains__(self.game_object)
         if dx1 > 0 > dx2 and dy1 > 0 > dy2:
-            overlap_area = Vector2D(
+            contact, entered = contacts.touch(
+                self,
+                collider,
                 dx1 if abs(dx1) < abs(dx2) else dx2,
                 dy1 if abs(dy1) < abs(dy2) else dy2)
-            if not already_collided:
-                self.colliders.add(collider.game_object)
-                collider.colliders.add(self.game_object)
-
-                self.game_object.handle_enter_collision(Collision(collider.game_object, overlap_area))
-                collider.game_object.handle_enter_collision(Collision(self.game_object, overlap_area * (-1)))
-            self.game_object.handle_collision(Collision(collider.game_object, overlap_area))
-            collider.game_object.handle_collision(Collision(self.game_object, overlap_area * (-1)))
-        elif already_collided:
-            self.colliders.remove(collider.game_object)
-            collider.colliders.remove(self.game_object)
-            self.game_object.handle_exit_collision(collider.game_object)
-            collider.game_object.handle_exit_collision(self.game_object)
+            if entered:
+                contacts.enter(self, collider, contact.first_collision)
+                contacts.enter(collider, self, contact.second_collision)
+            contacts.collide(self, collider, contact.first_collision)
+            contacts.collide(collider, self, contact.second_collision)
 
 
 class Collision(object):
-    collider: engine.gameobject.GameObject
+    collider: engine.gameobject.GameObject | None
     collision_vector: Vector2D
 
-    def __init__(self, collider: engine.gameobject.GameObject, collision_vector: Vector2D):
+    def __init__(self, collider: engine.gameobject.GameObject | None, collision_vector: Vector2D):
         self.collider = collider
         self.collision_vector = collision_vector
+
+
+CollisionHandler = Callable[['engine.gameobject.GameObject', Collision], None]
+ExitHandler = Callable[['engine.gameobject.GameObject', 'engine.gameobject.GameObject'], None]
+
+
+class Contact(object):
+    first: PhysicsState | None
+    second: PhysicsState | None
+    stamp: int
+    first_collision: Collision
+    second_collision: Collision
+
+    def __init__(self) -> None:
+        self.first = None
+        self.second = None
+        self.stamp = 0
+        self.first_collision = Collision(None, Vector2D())
+        self.second_collision = Collision(None, Vector2D())
+
+    def set(self, first: PhysicsState, second: PhysicsState, overlap_x: float, overlap_y: float) -> None:
+        self.first = first
+        self.second = second
+        self.first_collision.collider = second.game_object
+        self.first_collision.collision_vector.x = overlap_x
+        self.first_collision.collision_vector.y = overlap_y
+        self.second_collision.collider = first.game_object
+        self.second_collision.collision_vector.x = -overlap_x
+        self.second_collision.collision_vector.y = -overlap_y
+
+    def clear(self) -> None:
+        self.first = None
+        self.second = None
+        self.first_collision.collider = None
+        self.second_collision.collider = None
+
+
+class ContactCache(object):
+    tick: int
+    contacts: Dict[Tuple[int, int], Contact]
+    pool: List[Contact]
+    enterHandlers: Dict[Tuple[int, int], List[CollisionHandler]]
+    collisionHandlers: Dict[Tuple[int, int], List[CollisionHandler]]
+    exitHandlers: Dict[Tuple[int, int], List[ExitHandler]]
+
+    def __init__(self) -> None:
+        self.tick = 0
+        self.contacts = dict()
+        self.pool = list()
+        self.enterHandlers = dict()
+        self.collisionHandlers = dict()
+        self.exitHandlers = dict()
+
+    def add_enter_handler(self, layer: int, collider_layer: int, handler: CollisionHandler) -> None:
+        self.enterHandlers.setdefault((layer, collider_layer), list()).append(handler)
+
+    def add_collision_handler(self, layer: int, collider_layer: int, handler: CollisionHandler) -> None:
+        self.collisionHandlers.setdefault((layer, collider_layer), list()).append(handler)
+
+    def add_exit_handler(self, layer: int, collider_layer: int, handler: ExitHandler) -> None:
+        self.exitHandlers.setdefault((layer, collider_layer), list()).append(handler)
+
+    def enter(self, state: PhysicsState, collider: PhysicsState, collision: Collision) -> None:
+        state.game_object.handle_enter_collision(collision)
+        if self.enterHandlers:
+            for handler in self.enterHandlers.get((state.layer, collider.layer), ()):
+                handler(state.game_object, collision)
+
+    def collide(self, state: PhysicsState, collider: PhysicsState, collision: Collision) -> None:
+        state.game_object.handle_collision(collision)
+        if self.collisionHandlers:
+            for handler in self.collisionHandlers.get((state.layer, collider.layer), ()):
+                handler(state.game_object, collision)
+
+    def exit(self, state: PhysicsState, collider: PhysicsState) -> None:
+        state.game_object.handle_exit_collision(collider.game_object)
+        if self.exitHandlers:
+            for handler in self.exitHandlers.get((state.layer, collider.layer), ()):
+                handler(state.game_object, collider.game_object)
+
+    def begin_tick(self) -> None:
+        self.tick += 1
+
+    def touch(
+            self,
+            first: PhysicsState,
+            second: PhysicsState,
+            overlap_x: float,
+            overlap_y: float
+    ) -> Tuple[Contact, bool]:
+        first_id = id(first)
+        second_id = id(second)
+        key = (first_id, second_id) if first_id < second_id else (second_id, first_id)
+        contact = self.contacts.get(key)
+        entered = contact is None
+        if entered:
+            contact = self.pool.pop() if self.pool else Contact()
+            self.contacts[key] = contact
+            first.contactCount += 1
+            second.contactCount += 1
+        contact.stamp = self.tick
+        contact.set(first, second, overlap_x, overlap_y)
+        return contact, entered
+
+    def end_tick(self) -> None:
+        expired = [key for key, contact in self.contacts.items() if contact.stamp != self.tick]
+        for key in expired:
+            contact = self.contacts.pop(key)
+            first = contact.first
+            second = contact.second
+            contact.clear()
+            self.pool.append(contact)
+            first.contactCount -= 1
+            second.contactCount -= 1
+            self.exit(first, second)
+            self.exit(second, first)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Dict, List, Type, TypeVar
+
+import engine.gameobject
+from core.rect import Rect
+from engine.context import GameContext
+
+PooledObject = TypeVar('PooledObject', bound='engine.gameobject.GameObject')
+
+
+class ObjectPool(object):
+    free: Dict[type, List[engine.gameobject.GameObject]]
+    released: List[engine.gameobject.GameObject]
+    inUse: Dict[type, int]
+    created: Dict[type, int]
+
+    def __init__(self) -> None:
+        self.free = dict()
+        self.released = list()
+        self.inUse = dict()
+        self.created = dict()
+
+    def acquire(self, object_type: Type[PooledObject], context: GameContext, frame: Rect) -> PooledObject:
+        if not object_type.poolable:
+            raise RuntimeError("Objects of type " + object_type.__name__ + " cannot be pooled")
+        free = self.free.get(object_type)
+        if free:
+            game_object = free.pop()
+            game_object.reset(frame)
+        else:
+            game_object = object_type(context, frame)
+            self.created[object_type] = self.created.get(object_type, 0) + 1
+        game_object.pool = self
+        self.inUse[object_type] = self.inUse.get(object_type, 0) + 1
+        return game_object
+
+    def release(self, game_object: engine.gameobject.GameObject) -> None:
+        object_type = type(game_object)
+        self.inUse[object_type] -= 1
+        self.released.append(game_object)
+
+    def recycle(self) -> None:
+        for game_object in self.released:
+            self.free.setdefault(type(game_object), list()).append(game_object)
+        self.released.clear()
+
+    def in_use(self, object_type: type) -> int:
+        return self.inUse.get(object_type, 0)
+
+    def available(self, object_type: type) -> int:
+        return len(self.free.get(object_type, ()))
+
+    def size(self, object_type: type) -> int:
+        return self.created.get(object_type, 0)
@@ -0,0 +1,159 @@
+import ctypes
+import os
+import queue
+import struct
+import threading
+import zlib
+from typing import BinaryIO, List, Tuple
+
+import sdl2
+import sdl2.sdlimage
+
+
+class FrameWriter(object):
+    width: int
+    height: int
+    pitch: int
+
+    def open(self, width: int, height: int, pitch: int) -> None:
+        self.width = width
+        self.height = height
+        self.pitch = pitch
+
+    def write(self, number: int, pixels: ctypes.Array) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class PngFrameWriter(FrameWriter):
+    directory: str
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def open(self, width: int, height: int, pitch: int) -> None:
+        super().open(width, height, pitch)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def write(self, number: int, pixels: ctypes.Array) -> None:
+        surface = sdl2.SDL_CreateRGBSurfaceWithFormatFrom(
+            pixels, self.width, self.height, 32, self.pitch, sdl2.SDL_PIXELFORMAT_RGBA32)
+        if not surface:
+            raise RuntimeError("Surface could not be created. SDL Error: "
+                               + str(sdl2.SDL_GetError()))
+        path = os.path.join(self.directory, "frame%06d.png" % number)
+        if sdl2.sdlimage.IMG_SavePNG(surface, path.encode()) != 0:
+            sdl2.SDL_FreeSurface(surface)
+            raise RuntimeError("Unable to save image "
+                               + path
+                               + "! SDL_image Error: "
+                               + str(sdl2.sdlimage.IMG_GetError()))
+        sdl2.SDL_FreeSurface(surface)
+
+
+class ChunkedFrameWriter(FrameWriter):
+    path: str
+    level: int
+    file: BinaryIO | None
+
+    def __init__(self, path: str, level: int = 1) -> None:
+        self.path = path
+        self.level = level
+        self.file = None
+
+    def open(self, width: int, height: int, pitch: int) -> None:
+        super().open(width, height, pitch)
+        self.file = open(self.path, "wb")
+        self.file.write(b"RGBA" + struct.pack("<III", width, height, pitch))
+
+    def write(self, number: int, pixels: ctypes.Array) -> None:
+        chunk = zlib.compress(pixels, self.level)
+        self.file.write(struct.pack("<II", number, len(chunk)))
+        self.file.write(chunk)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class FrameRecorder(object):
+    writer: FrameWriter
+    width: int
+    height: int
+    pitch: int
+    rect: sdl2.SDL_Rect
+    buffers: List[ctypes.Array]
+    free: queue.Queue
+    pending: queue.Queue
+    thread: threading.Thread
+    frameNumber: int
+    captured: int
+    written: int
+    dropped: int
+    error: Exception | None
+
+    def __init__(self, writer: FrameWriter, width: int, height: int, capacity: int = 8) -> None:
+        self.writer = writer
+        self.width = width
+        self.height = height
+        self.pitch = width * 4
+        self.rect = sdl2.SDL_Rect(0, 0, width, height)
+        self.buffers = [(ctypes.c_uint8 * (self.pitch * height))() for _ in range(capacity)]
+        self.free = queue.Queue()
+        for index in range(capacity):
+            self.free.put(index)
+        self.pending = queue.Queue()
+        self.frameNumber = 0
+        self.captured = 0
+        self.written = 0
+        self.dropped = 0
+        self.error = None
+        self.writer.open(width, height, self.pitch)
+        self.thread = threading.Thread(target=self.run, name="FrameRecorder", daemon=True)
+        self.thread.start()
+
+    def capture(self, renderer: sdl2.SDL_Renderer) -> bool:
+        if self.error:
+            return False
+        number = self.frameNumber
+        self.frameNumber += 1
+        try:
+            index = self.free.get_nowait()
+        except queue.Empty:
+            self.dropped += 1
+            return False
+
+        if sdl2.SDL_RenderReadPixels(
+                renderer, self.rect, sdl2.SDL_PIXELFORMAT_RGBA32, self.buffers[index], self.pitch) != 0:
+            self.free.put(index)
+            raise RuntimeError("Unable to read rendered pixels! SDL Error: "
+                               + str(sdl2.SDL_GetError()))
+        self.captured += 1
+        self.pending.put((index, number))
+        return True
+
+    def run(self) -> None:
+        while True:
+            item: Tuple[int, int] | None = self.pending.get()
+            if item is None:
+                break
+            index, number = item
+            if not self.error:
+                try:
+                    self.writer.write(number, self.buffers[index])
+                    self.written += 1
+                except Exception as error:
+                    self.error = error
+            self.free.put(index)
+        try:
+            self.writer.close()
+        except Exception as error:
+            if not self.error:
+                self.error = error
+
+    def close(self) -> None:
+        self.pending.put(None)
+        self.thread.join()
+        if self.error:
+            raise self.error
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import ctypes
+from typing import List, Tuple
+
+import numpy
 import sdl2
 import sdl2.sdlimage
 
@@ -7,15 +11,52 @@ from core.color import Color
 from core.size import Size
 from core.vector2d import Vector2D
 from engine.context import GameContext
+from engine.fill import FillBatch, FillColor
+from engine.settings import GameSettings
+
+DrawRect = Tuple[float, float, float, float]
+
+
+class GeometryCommand(object):
+    vertices: numpy.ndarray
+    colors: numpy.ndarray
+    indices: numpy.ndarray
+    count: int
+
+    def __init__(self, vertices: numpy.ndarray, colors: numpy.ndarray, indices: numpy.ndarray, count: int) -> None:
+        self.vertices = vertices
+        self.colors = colors
+        self.indices = indices
+        self.count = count
+
+    def submit(self, renderer: sdl2.SDL_Renderer) -> None:
+        sdl2.SDL_SetRenderDrawBlendMode(renderer, sdl2.SDL_BLENDMODE_BLEND)
+        sdl2.SDL_RenderGeometryRaw(
+            renderer,
+            None,
+            self.vertices.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+            8,
+            self.colors.ctypes.data_as(ctypes.POINTER(sdl2.SDL_Color)),
+            4,
+            None,
+            0,
+            self.count * 4,
+            self.indices.ctypes.data_as(ctypes.c_void_p),
+            self.count * 6,
+            4)
+
+
+DrawCommand = Tuple[sdl2.SDL_Texture | None, DrawRect | None, DrawRect, int, FillColor | None] | GeometryCommand
 
 
 class RenderObject(object):
-    texture: sdl2.SDL_Texture
+    texture: sdl2.SDL_Texture | None
     renderFrameSize: sdl2.SDL_Rect
     renderFlip: sdl2.SDL_RendererFlip = sdl2.SDL_FLIP_NONE
     fullRender: bool = True
+    fillColor: FillColor | None = None
 
-    def __init__(self, texture: sdl2.SDL_Texture) -> None:
+    def __init__(self, texture: sdl2.SDL_Texture | None) -> None:
         self.texture = texture
 
     @classmethod
@@ -27,13 +68,10 @@ class RenderObject(object):
         return RenderObject(texture)
 
     @classmethod
-    def render_object_from_color(cls, renderer: sdl2.SDL_Renderer, color: Color) -> RenderObject:
-        texture = sdl2.SDL_CreateTexture(renderer, sdl2.SDL_PIXELFORMAT_RGBA8888, sdl2.SDL_TEXTUREACCESS_TARGET, 1, 1)
-        sdl2.SDL_SetRenderTarget(renderer, texture)
-        sdl2.SDL_SetRenderDrawColor(renderer, color.r, color.g, color.b, color.a)
-        sdl2.SDL_RenderClear(renderer)
-        sdl2.SDL_SetRenderTarget(renderer, None)
-        return RenderObject(texture)
+    def render_object_from_color(cls, color: Color) -> RenderObject:
+        render_object = RenderObject(None)
+        render_object.fillColor = (color.r, color.g, color.b, color.a)
+        return render_object
 
     @classmethod
     def render_object_from_file(cls, renderer: sdl2.SDL_Renderer, path: bytes) -> RenderObject:
@@ -60,25 +98,70 @@ class RenderObject(object):
         render_object.fullRender = False
         return render_object
 
-    def render(
-            self,
-            context: GameContext,
-            position: Vector2D,
-            size: Size,
-            camera_position: Vector2D,
-            camera_size: Size
-    ) -> None:
-        render_position = position \
-                          + Vector2D(-size.width / 2, -size.height / 2) \
-                          - camera_position \
-                          - Vector2D(-camera_size.width / 2, -camera_size.height / 2)
-
-        rect = sdl2.SDL_Rect()
-        rect.x = round(context.settings.windowWidth * (render_position.x / camera_size.width))
-        rect.y = round(context.settings.windowHeight * (render_position.y / camera_size.height))
-        rect.w = round(context.settings.windowWidth * (size.width / camera_size.width))
-        rect.h = round(context.settings.windowHeight * (size.height / camera_size.height))
+    def destination(self, view: ViewTransform, x: float, y: float, size: Size) -> DrawRect:
+        return ((x - size.width / 2) * view.scaleX + view.offsetX,
+                (y - size.height / 2) * view.scaleY + view.offsetY,
+                size.width * view.scaleX,
+                size.height * view.scaleY)
+
+    def render(self, context: GameContext, view: ViewTransform, x: float, y: float, size: Size) -> None:
+        if self.fillColor:
+            context.fills.add(self.fillColor, self.destination(view, x, y, size))
+            return
+        rect = view.rect
+        rect.x = (x - size.width / 2) * view.scaleX + view.offsetX
+        rect.y = (y - size.height / 2) * view.scaleY + view.offsetY
+        rect.w = size.width * view.scaleX
+        rect.h = size.height * view.scaleY
         render_frame = None
         if not self.fullRender:
             render_frame = self.renderFrameSize
-        sdl2.SDL_RenderCopyEx(context.renderer, self.texture, render_frame, rect, 0, None, self.renderFlip)
+        sdl2.SDL_RenderCopyExF(context.renderer, self.texture, render_frame, rect, 0, None, self.renderFlip)
+
+    def draw_command(self, view: ViewTransform, x: float, y: float, size: Size) -> DrawCommand:
+        render_frame = None
+        if not self.fullRender and not self.fillColor:
+            render_frame = (self.renderFrameSize.x, self.renderFrameSize.y,
+                            self.renderFrameSize.w, self.renderFrameSize.h)
+        return self.texture, render_frame, self.destination(view, x, y, size), self.renderFlip, self.fillColor
+
+
+class ViewTransform(object):
+    scaleX: float
+    scaleY: float
+    offsetX: float
+    offsetY: float
+    rect: sdl2.SDL_FRect
+
+    def __init__(self) -> None:
+        self.scaleX = 1
+        self.scaleY = 1
+        self.offsetX = 0
+        self.offsetY = 0
+        self.rect = sdl2.SDL_FRect()
+
+    def update(self, settings: GameSettings, camera_position: Vector2D, camera_size: Size) -> None:
+        self.scaleX = settings.windowWidth / camera_size.width
+        self.scaleY = settings.windowHeight / camera_size.height
+        self.offsetX = (camera_size.width / 2 - camera_position.x) * self.scaleX
+        self.offsetY = (camera_size.height / 2 - camera_position.y) * self.scaleY
+
+
+def submit_draw_commands(renderer: sdl2.SDL_Renderer, commands: List[DrawCommand], fills: FillBatch) -> None:
+    source = sdl2.SDL_Rect()
+    destination = sdl2.SDL_FRect()
+    for command in commands:
+        if isinstance(command, GeometryCommand):
+            command.submit(renderer)
+            continue
+        texture, render_frame, rect, flip, fill_color = command
+        if fill_color:
+            fills.add(fill_color, rect)
+            continue
+        destination.x, destination.y, destination.w, destination.h = rect
+        if render_frame:
+            source.x, source.y, source.w, source.h = render_frame
+            sdl2.SDL_RenderCopyExF(renderer, texture, source, destination, 0, None, flip)
+        else:
+            sdl2.SDL_RenderCopyExF(renderer, texture, None, destination, 0, None, flip)
+    fills.flush(renderer)
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Set, Tuple
+
+from core.vector2d import Vector2D
+from engine.physics import PhysicsState
+
+CellRange = Tuple[int, int, int, int]
+
+
+class SpatialHit(object):
+    body: PhysicsState
+    distance: float
+
+    def __init__(self, body: PhysicsState, distance: float) -> None:
+        self.body = body
+        self.distance = distance
+
+
+class SpatialIndex(object):
+    cellSize: float
+    cells: Dict[Tuple[int, int], Set[PhysicsState]]
+    ranges: Dict[PhysicsState, CellRange]
+    moving: Set[PhysicsState]
+    extent: CellRange | None
+
+    def __init__(self, cell_size: float = 20) -> None:
+        self.cellSize = cell_size
+        self.cells = dict()
+        self.ranges = dict()
+        self.moving = set()
+        self.extent = None
+
+    @staticmethod
+    def bounds(body: PhysicsState) -> Tuple[float, float, float, float]:
+        position = body.game_object.global_position()
+        size = body.game_object.frame.size
+        return (position.x - size.width / 2,
+                position.y - size.height / 2,
+                position.x + size.width / 2,
+                position.y + size.height / 2)
+
+    def cell_range(self, left: float, top: float, right: float, bottom: float) -> CellRange:
+        return (math.floor(left / self.cellSize),
+                math.floor(top / self.cellSize),
+                math.floor(right / self.cellSize),
+                math.floor(bottom / self.cellSize))
+
+    def insert(self, body: PhysicsState) -> None:
+        cell_range = self.cell_range(*self.bounds(body))
+        self.ranges[body] = cell_range
+        if not body.still:
+            self.moving.add(body)
+        first_column, first_row, last_column, last_row = cell_range
+        if self.extent:
+            self.extent = (min(self.extent[0], first_column),
+                           min(self.extent[1], first_row),
+                           max(self.extent[2], last_column),
+                           max(self.extent[3], last_row))
+        else:
+            self.extent = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                self.cells.setdefault((column, row), set()).add(body)
+
+    def remove(self, body: PhysicsState) -> None:
+        cell_range = self.ranges.pop(body, None)
+        if not cell_range:
+            return
+        self.moving.discard(body)
+        first_column, first_row, last_column, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self.cells[(column, row)]
+                cell.discard(body)
+                if not cell:
+                    del self.cells[(column, row)]
+
+    def update(self, body: PhysicsState) -> None:
+        if self.ranges.get(body) != self.cell_range(*self.bounds(body)):
+            self.remove(body)
+            self.insert(body)
+
+    def refresh(self) -> None:
+        for body in self.moving.copy():
+            self.update(body)
+
+    def candidates(self, cell_range: CellRange, mask: int) -> Set[PhysicsState]:
+        found: Set[PhysicsState] = set()
+        first_column, first_row, last_column, last_row = cell_range
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self.cells.get((column, row))
+                if cell:
+                    found.update(cell)
+        return {body for body in found if body.layer & mask and not body.game_object.removed}
+
+    def region(
+            self,
+            left: float,
+            top: float,
+            right: float,
+            bottom: float,
+            mask: int = 0xffffffff
+    ) -> List[SpatialHit]:
+        center_x = (left + right) / 2
+        center_y = (top + bottom) / 2
+        hits: List[SpatialHit] = list()
+        for body in self.candidates(self.cell_range(left, top, right, bottom), mask):
+            body_left, body_top, body_right, body_bottom = self.bounds(body)
+            if body_left < right and left < body_right and body_top < bottom and top < body_bottom:
+                hits.append(SpatialHit(body, math.hypot(
+                    (body_left + body_right) / 2 - center_x,
+                    (body_top + body_bottom) / 2 - center_y)))
+        hits.sort(key=lambda hit: hit.distance)
+        return hits
+
+    def point(self, x: float, y: float, mask: int = 0xffffffff) -> List[SpatialHit]:
+        hits: List[SpatialHit] = list()
+        for body in self.candidates(self.cell_range(x, y, x, y), mask):
+            left, top, right, bottom = self.bounds(body)
+            if left <= x < right and top <= y < bottom:
+                hits.append(SpatialHit(body, math.hypot((left + right) / 2 - x, (top + bottom) / 2 - y)))
+        hits.sort(key=lambda hit: hit.distance)
+        return hits
+
+    def ray_cells(self, origin: Vector2D, direction: Vector2D, max_distance: float) -> List[Tuple[int, int]]:
+        if not self.extent:
+            return list()
+        first_column, first_row, last_column, last_row = self.extent
+        entry_x, exit_x = self.slab(
+            origin.x, direction.x, first_column * self.cellSize, (last_column + 1) * self.cellSize)
+        entry_y, exit_y = self.slab(
+            origin.y, direction.y, first_row * self.cellSize, (last_row + 1) * self.cellSize)
+        entry = max(entry_x, entry_y, 0)
+        max_distance = min(exit_x, exit_y, max_distance) - entry
+        if max_distance < 0:
+            return list()
+        origin = origin + direction * entry
+
+        column = math.floor(origin.x / self.cellSize)
+        row = math.floor(origin.y / self.cellSize)
+        step_column = 1 if direction.x > 0 else -1
+        step_row = 1 if direction.y > 0 else -1
+        if direction.x:
+            next_x = (column + (step_column > 0)) * self.cellSize
+            crossing_x = (next_x - origin.x) / direction.x
+            delta_x = self.cellSize / abs(direction.x)
+        else:
+            crossing_x = delta_x = math.inf
+        if direction.y:
+            next_y = (row + (step_row > 0)) * self.cellSize
+            crossing_y = (next_y - origin.y) / direction.y
+            delta_y = self.cellSize / abs(direction.y)
+        else:
+            crossing_y = delta_y = math.inf
+
+        visited = [(column, row)]
+        while min(crossing_x, crossing_y) <= max_distance:
+            if crossing_x < crossing_y:
+                column += step_column
+                crossing_x += delta_x
+            else:
+                row += step_row
+                crossing_y += delta_y
+            visited.append((column, row))
+        return visited
+
+    def raycast(
+            self,
+            origin: Vector2D,
+            direction: Vector2D,
+            max_distance: float,
+            mask: int = 0xffffffff
+    ) -> List[SpatialHit]:
+        length = math.hypot(direction.x, direction.y)
+        if not length:
+            return self.point(origin.x, origin.y, mask)
+        direction = direction * (1 / length)
+
+        found: Set[PhysicsState] = set()
+        for cell in self.ray_cells(origin, direction, max_distance):
+            bodies = self.cells.get(cell)
+            if bodies:
+                found.update(bodies)
+
+        hits: List[SpatialHit] = list()
+        for body in found:
+            if not body.layer & mask or body.game_object.removed:
+                continue
+            left, top, right, bottom = self.bounds(body)
+            entry_x, exit_x = self.slab(origin.x, direction.x, left, right)
+            entry_y, exit_y = self.slab(origin.y, direction.y, top, bottom)
+            entry = max(entry_x, entry_y, 0)
+            if entry <= min(exit_x, exit_y, max_distance):
+                hits.append(SpatialHit(body, entry))
+        hits.sort(key=lambda hit: hit.distance)
+        return hits
+
+    @staticmethod
+    def slab(start: float, delta: float, low: float, high: float) -> Tuple[float, float]:
+        if delta:
+            near = (low - start) / delta
+            far = (high - start) / delta
+            return (near, far) if near < far else (far, near)
+        if low <= start <= high:
+            return -math.inf, math.inf
+        return math.inf, -math.inf
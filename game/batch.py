@@ -0,0 +1,124 @@
+import functools
+import itertools
+import multiprocessing
+import random
+import time
+from typing import List, Sequence
+
+import sdl2
+
+from game.game import Game
+from game.scenario import Scenario
+
+
+class RandomInput(object):
+    rng: random.Random
+    holdTicks: int
+    ticksLeft: int
+    state: bytearray
+
+    def __init__(self, seed: int | None, hold_ticks: int = 30) -> None:
+        self.rng = random.Random(seed)
+        self.holdTicks = hold_ticks
+        self.ticksLeft = 0
+        self.state = bytearray(sdl2.SDL_NUM_SCANCODES)
+
+    def next(self) -> bytearray:
+        if self.ticksLeft <= 0:
+            self.ticksLeft = self.rng.randint(1, self.holdTicks)
+            direction = self.rng.choice((sdl2.SDL_SCANCODE_LEFT, sdl2.SDL_SCANCODE_RIGHT, None))
+            self.state[sdl2.SDL_SCANCODE_LEFT] = direction == sdl2.SDL_SCANCODE_LEFT
+            self.state[sdl2.SDL_SCANCODE_RIGHT] = direction == sdl2.SDL_SCANCODE_RIGHT
+        self.ticksLeft -= 1
+        self.state[sdl2.SDL_SCANCODE_UP] = self.rng.random() < 0.1
+        return self.state
+
+
+class RunMetrics(object):
+    scenario: Scenario
+    ticks: int
+    won: bool
+    dead: bool
+    health: int
+    power: int
+    tickTime: float
+
+    def __init__(
+            self,
+            scenario: Scenario,
+            ticks: int,
+            won: bool,
+            dead: bool,
+            health: int,
+            power: int,
+            tick_time: float
+    ) -> None:
+        self.scenario = scenario
+        self.ticks = ticks
+        self.won = won
+        self.dead = dead
+        self.health = health
+        self.power = power
+        self.tickTime = tick_time
+
+    def outcome(self) -> str:
+        if self.won:
+            return "won"
+        if self.dead:
+            return "died"
+        return "timeout"
+
+
+def run_scenario(scenario: Scenario, max_ticks: int = 10000) -> RunMetrics:
+    game = Game(scenario, headless=True)
+    player = game.player
+    keyboard = RandomInput(scenario.seed)
+    ticks = 0
+    elapsed = 0.0
+    while ticks < max_ticks and not player.dead and not player.won:
+        keyboard_state = keyboard.next()
+        start = time.perf_counter()
+        game.step(keyboard_state)
+        elapsed += time.perf_counter() - start
+        ticks += 1
+    game.exit()
+    return RunMetrics(scenario, ticks, player.won, player.dead, player.health, player.power,
+                      elapsed / ticks if ticks else 0.0)
+
+
+def run_batch(
+        scenarios: Sequence[Scenario],
+        max_ticks: int = 10000,
+        processes: int | None = None
+) -> List[RunMetrics]:
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(functools.partial(run_scenario, max_ticks=max_ticks), scenarios)
+
+
+def format_table(results: Sequence[RunMetrics]) -> str:
+    header = ("speed", "jump", "gravity", "count", "powers", "seed", "ticks", "outcome", "health", "power", "ms/tick")
+    rows = [header]
+    for result in results:
+        scenario = result.scenario
+        rows.append((
+            "%.2f" % scenario.speed,
+            "%.2f" % scenario.jumpSpeed,
+            "%.2f" % scenario.gravityForce,
+            str(scenario.count),
+            str(scenario.powerCount),
+            str(scenario.seed),
+            str(result.ticks),
+            result.outcome(),
+            str(result.health),
+            str(result.power),
+            "%.3f" % (result.tickTime * 1000),
+        ))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join("  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
+
+
+if __name__ == '__main__':
+    print(format_table(run_batch([
+        Scenario(jump_speed=jump_speed, gravity_force=gravity_force, seed=seed)
+        for jump_speed, gravity_force, seed in itertools.product((2.0, 2.5, 3.0), (0.08, 0.1, 0.12), range(4))
+    ])))
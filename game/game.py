@@ -1,5 +1,9 @@
 import ctypes
+import os
+import queue
 import random
+import threading
+from typing import List, Tuple
 
 import sdl2
 import sdl2.sdlimage
@@ -10,25 +14,49 @@ from core.rect import Rect
 from core.vector2d import Vector2D
 from engine.animation import Animation
 from engine.context import GameContext
+from engine.framebuffer import Framebuffer
 from engine.gameobject import GameObject
-from engine.render import RenderObject
+from engine.particles import ParticleEmitter
+from engine.physics import ContactCache
+from engine.pool import ObjectPool
+from engine.recorder import FrameRecorder, FrameWriter
+from engine.render import RenderObject, DrawCommand, ViewTransform, submit_draw_commands
 from engine.settings import GameSettings
 from game.objects.consumable import Consumable
 from game.objects.frame import Frame
+from game.objects.layer import Layer
 from game.objects.player import Player
 from game.objects.solid import Solid
 from game.objects.ui.bar import Bar
+from game.objects.ui.overlay import Overlay
 from game.objects.ui.text import Text
 from game.objects.world import World
+from game.scenario import Scenario
 from util import pair_range
 
 
 class Game:
     context: GameContext
     world: World
-    ui: GameObject
+    ui: Overlay
+    contacts: ContactCache
+    pool: ObjectPool
+    worldView: ViewTransform
+    uiView: ViewTransform
+    player: Player
+    scenario: Scenario
+    headless: bool
+    framebuffer: Framebuffer | None
+    recorder: FrameRecorder | None
+
+    def __init__(self, scenario: Scenario | None = None, headless: bool = False) -> None:
+        self.scenario = scenario or Scenario()
+        self.headless = headless
+        self.framebuffer = None
+        self.recorder = None
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
 
-    def __init__(self) -> None:
         if sdl2.SDL_Init(sdl2.SDL_INIT_VIDEO) < 0:
             raise RuntimeError("SDL could not initialize! SDL Error: "
                                + str(sdl2.SDL_GetError()))
@@ -47,22 +75,31 @@ class Game:
 
         settings = GameSettings('Test game', 800, 600)
 
-        window = sdl2.SDL_CreateWindow(bytes(settings.name, 'utf-8'),
-                                       sdl2.SDL_WINDOWPOS_UNDEFINED, sdl2.SDL_WINDOWPOS_UNDEFINED,
-                                       settings.windowWidth,
-                                       settings.windowHeight,
-                                       sdl2.SDL_WINDOW_SHOWN
-                                       )
-        if not window:
-            raise RuntimeError("Window could not be created. SDL Error: "
-                               + str(sdl2.SDL_GetError()))
-
-        self.context = GameContext(
-            sdl2.SDL_CreateRenderer(window, -1, sdl2.SDL_RENDERER_ACCELERATED | sdl2.SDL_RENDERER_PRESENTVSYNC),
-            settings)
+        if headless:
+            self.framebuffer = Framebuffer(settings.windowWidth, settings.windowHeight)
+            renderer = self.framebuffer.renderer
+        else:
+            window = sdl2.SDL_CreateWindow(bytes(settings.name, 'utf-8'),
+                                           sdl2.SDL_WINDOWPOS_UNDEFINED, sdl2.SDL_WINDOWPOS_UNDEFINED,
+                                           settings.windowWidth,
+                                           settings.windowHeight,
+                                           sdl2.SDL_WINDOW_SHOWN
+                                           )
+            if not window:
+                raise RuntimeError("Window could not be created. SDL Error: "
+                                   + str(sdl2.SDL_GetError()))
+            renderer = sdl2.SDL_CreateRenderer(
+                window, -1, sdl2.SDL_RENDERER_ACCELERATED | sdl2.SDL_RENDERER_PRESENTVSYNC)
+
+        self.context = GameContext(renderer, settings)
 
         sdl2.SDL_SetRenderDrawColor(self.context.renderer, 0xff, 0xff, 0xff, 0xff)
 
+        self.pool = ObjectPool()
+        self.contacts = ContactCache()
+        self.contacts.add_enter_handler(Layer.PLAYER, Layer.CONSUMABLE, Player.collect)
+        self.contacts.add_enter_handler(Layer.SOLID, Layer.PLAYER, Solid.damage_on_impact)
+
         self.world = World(
             self.context,
             Rect.make(
@@ -70,8 +107,6 @@ class Game:
                 self.context.settings.windowWidth / 2,
                 self.context.settings.windowHeight / 2))
 
-        self.ui = GameObject(self.context, Rect(Vector2D(), self.world.camera.originalSize.copy()))
-
         player = Player(self.context, Rect.make(0, 20, 10, 20))
         player.idleAnimation = Animation.animation_with_single_render_object(
             RenderObject.render_object_from_file(self.context.renderer, b"img/idle.png"))
@@ -84,10 +119,17 @@ class Game:
         player.crouchMoveAnimation = Animation.animation_with_single_render_object(
             RenderObject.render_object_from_file(self.context.renderer, b"img/crouch.png"))
 
-        player.speed = 1.3
-        player.jumpSpeed = 2.5
-        player.physics.gravityForce = 0.1
+        player.speed = self.scenario.speed
+        player.jumpSpeed = self.scenario.jumpSpeed
+        player.physics.gravityForce = self.scenario.gravityForce
+        player.winPower = max(1, min(self.scenario.powerCount, self.scenario.count))
         player.add_child(self.world.camera)
+        self.player = player
+
+        particles = ParticleEmitter(self.context, Rect.make(0, 0, 0, 0), seed=self.scenario.seed)
+        particles.gravity = self.scenario.gravityForce
+        player.add_child(particles)
+        player.particles = particles
 
         self.world.add_child(Frame(self.context, Rect.make(
             0, 0,
@@ -95,11 +137,12 @@ class Game:
             self.world.frame.size.height
         ), 10))
 
-        count = 200
-        power_count = 100
+        count = self.scenario.count
+        power_count = self.scenario.powerCount
         x = int(self.world.frame.size.width / 10 - 2)
         y = int(self.world.frame.size.height / 10 - 2)
-        for pair in random.sample(set(pair_range(x, y)), count):
+        power_render_object = RenderObject.render_object_from_color(Color(0, 0xff, 0, 0x80))
+        for pair in random.Random(self.scenario.seed).sample(list(pair_range(x, y)), count):
             random_x = pair[0]
             random_y = pair[1]
 
@@ -108,9 +151,8 @@ class Game:
                 (self.world.frame.size.height / 2) - 15 - random_y * 10,
                 10, 10)
             if power_count:
-                game_object = Consumable(self.context, rect)
-                game_object.renderObject = RenderObject.render_object_from_color(
-                    self.context.renderer, Color(0, 0xff, 0, 0x80))
+                game_object = self.pool.acquire(Consumable, self.context, rect)
+                game_object.renderObject = power_render_object
                 power_count -= 1
             else:
                 game_object = Solid(self.context, rect)
@@ -120,7 +162,10 @@ class Game:
 
         self.world.add_child(player)
 
-        self.ui = GameObject(self.context, Rect(Vector2D(), self.world.camera.originalSize))
+        self.ui = Overlay(self.context, Rect(Vector2D(), self.world.camera.originalSize))
+        self.worldView = ViewTransform()
+        self.uiView = ViewTransform()
+        self.uiView.update(self.context.settings, Vector2D(), self.world.camera.originalSize)
 
         death_text = Text(self.context, Rect.make(0, 0, 100, 10))
         death_text.set_text(b"You died! Game Over!")
@@ -142,33 +187,159 @@ class Game:
             -self.world.camera.originalSize.width / 2 + 16,
             -self.world.camera.originalSize.height / 2 + 2.5,
             30, 3))
-        health_bar_holder.renderObject = RenderObject.render_object_from_color(self.context.renderer, Color.black())
+        health_bar_holder.renderObject = RenderObject.render_object_from_color(Color.black())
         self.ui.add_child(health_bar_holder)
 
         power_bar_holder = GameObject(self.context, Rect.make(
             self.world.camera.originalSize.width / 2 - 16,
             -self.world.camera.originalSize.height / 2 + 2.5,
             30, 3))
-        power_bar_holder.renderObject = RenderObject.render_object_from_color(self.context.renderer, Color.black())
+        power_bar_holder.renderObject = RenderObject.render_object_from_color(Color.black())
         self.ui.add_child(power_bar_holder)
 
         health_bar = Bar(self.context, Rect.make(0, 0, 29, 2))
-        health_bar.renderObject = RenderObject.render_object_from_color(self.context.renderer, Color.red())
+        health_bar.renderObject = RenderObject.render_object_from_color(Color.red())
         health_bar_holder.add_child(health_bar)
         player.healthBar = health_bar
 
         power_bar = Bar(self.context, Rect.make(0, 0, 29, 2))
-        power_bar.renderObject = RenderObject.render_object_from_color(self.context.renderer, Color.green())
+        power_bar.renderObject = RenderObject.render_object_from_color(Color.green())
         power_bar.set_value(0)
         power_bar_holder.add_child(power_bar)
         player.powerBar = power_bar
 
-    @staticmethod
-    def exit() -> None:
+    def exit(self) -> None:
+        if self.framebuffer:
+            self.framebuffer.destroy()
+            self.framebuffer = None
         sdl2.SDL_Quit()
         sdl2.sdlimage.IMG_Quit()
         sdl2.sdlttf.TTF_Quit()
 
+    def step(self, keyboard_state) -> None:
+        self.world.handle_keyboard(keyboard_state)
+
+        self.world.clean()
+
+        self.world.process_physics()
+
+        self.world.detect_collisions(self.contacts)
+
+        self.pool.recycle()
+
+        self.world.animate()
+
+    def render(self) -> None:
+        ui_draws = self.ui.take_draws(self.uiView)
+        if ui_draws is not None:
+            self.ui.compose(ui_draws)
+
+        sdl2.SDL_SetRenderDrawColor(self.context.renderer, 0xff, 0xff, 0xff, 0xff)
+        sdl2.SDL_RenderClear(self.context.renderer)
+
+        self.worldView.update(
+            self.context.settings,
+            self.world.camera.global_position(),
+            self.world.camera.frame.size)
+        self.world.render(self.worldView)
+        self.context.fills.flush(self.context.renderer)
+        self.ui.render(self.uiView)
+
+        if self.recorder:
+            self.recorder.capture(self.context.renderer)
+
+        sdl2.SDL_RenderPresent(self.context.renderer)
+
+    def draw_list(self) -> Tuple[List[DrawCommand], List[DrawCommand] | None]:
+        draws: List[DrawCommand] = list()
+        self.worldView.update(
+            self.context.settings,
+            self.world.camera.global_position(),
+            self.world.camera.frame.size)
+        self.world.collect_draws(self.worldView, draws)
+        return draws, self.ui.take_draws(self.uiView)
+
+    def present(self, draws: List[DrawCommand], ui_draws: List[DrawCommand] | None) -> None:
+        if ui_draws is not None:
+            self.ui.compose(ui_draws)
+
+        sdl2.SDL_SetRenderDrawColor(self.context.renderer, 0xff, 0xff, 0xff, 0xff)
+        sdl2.SDL_RenderClear(self.context.renderer)
+
+        submit_draw_commands(self.context.renderer, draws, self.context.fills)
+        self.ui.render(self.uiView)
+
+        if self.recorder:
+            self.recorder.capture(self.context.renderer)
+
+        sdl2.SDL_RenderPresent(self.context.renderer)
+
+    def simulate(self, inputs: queue.Queue, frames: queue.Queue) -> None:
+        try:
+            while True:
+                tick_input: Tuple[List[sdl2.SDL_Event], bytes] | None = inputs.get()
+                if tick_input is None:
+                    break
+                events, keyboard_state = tick_input
+                for e in events:
+                    self.world.handle_event(e)
+                    self.ui.handle_event(e)
+                self.step(keyboard_state)
+                draws, ui_draws = self.draw_list()
+                frames.put((draws, ui_draws, self.context.quit))
+        except Exception as error:
+            frames.put(error)
+
+    def start_recording(self, writer: FrameWriter, capacity: int = 8) -> None:
+        width = ctypes.c_int()
+        height = ctypes.c_int()
+        if sdl2.SDL_GetRendererOutputSize(self.context.renderer, ctypes.byref(width), ctypes.byref(height)) != 0:
+            raise RuntimeError("Unable to query renderer output size! SDL Error: "
+                               + str(sdl2.SDL_GetError()))
+        self.recorder = FrameRecorder(writer, width.value, height.value, capacity)
+
+    @staticmethod
+    def poll_input(inputs: queue.Queue) -> bool:
+        quit_requested = False
+        events: List[sdl2.SDL_Event] = list()
+        e = sdl2.SDL_Event()
+        while sdl2.SDL_PollEvent(ctypes.byref(e)) != 0:
+            if e.type == sdl2.SDL_QUIT:
+                quit_requested = True
+            events.append(sdl2.SDL_Event.from_buffer_copy(e))
+        key_count = ctypes.c_int()
+        keyboard_state = sdl2.SDL_GetKeyboardState(ctypes.byref(key_count))
+        inputs.put((events, ctypes.string_at(keyboard_state, key_count.value)))
+        return quit_requested
+
+    def run_pipelined(self) -> None:
+        inputs: queue.Queue = queue.Queue(maxsize=1)
+        frames: queue.Queue = queue.Queue(maxsize=1)
+        simulation = threading.Thread(target=self.simulate, args=(inputs, frames), name="Simulation")
+        simulation.start()
+
+        error: Exception | None = None
+        quit_requested = self.poll_input(inputs)
+        while True:
+            frame = frames.get()
+            if isinstance(frame, Exception):
+                error = frame
+                break
+            draws, ui_draws, world_quit = frame
+            if quit_requested or world_quit:
+                break
+            quit_requested = self.poll_input(inputs)
+            self.present(draws, ui_draws)
+
+        if not error:
+            inputs.put(None)
+        simulation.join()
+        if self.recorder:
+            self.recorder.close()
+        self.exit()
+        if error:
+            raise error
+
     def run(self) -> None:
         e = sdl2.SDL_Event()
         while not self.context.quit:
@@ -176,29 +347,12 @@ class Game:
                 if e.type == sdl2.SDL_QUIT:
                     self.context.quit = True
                 self.world.handle_event(e)
+                self.ui.handle_event(e)
 
-            self.world.handle_keyboard(sdl2.SDL_GetKeyboardState(None))
-
-            self.world.clean()
-
-            self.world.process_physics()
-
-            self.world.detect_collisions()
-
-            self.world.animate()
-
-            sdl2.SDL_SetRenderDrawColor(self.context.renderer, 0xff, 0xff, 0xff, 0xff)
-            sdl2.SDL_RenderClear(self.context.renderer)
-
-            self.world.render(
-                self.world.frame.center,
-                self.world.camera.global_position(),
-                self.world.camera.frame.size)
-            self.ui.render(
-                self.ui.frame.center,
-                Vector2D(),
-                self.world.camera.originalSize)
+            self.step(sdl2.SDL_GetKeyboardState(None))
 
-            sdl2.SDL_RenderPresent(self.context.renderer)
+            self.render()
 
+        if self.recorder:
+            self.recorder.close()
         self.exit()
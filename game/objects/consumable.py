@@ -2,9 +2,15 @@ from core.rect import Rect
 from engine.context import GameContext
 from engine.gameobject import GameObject
 from engine.physics import PhysicsState
+from game.objects.layer import Layer
 
 
 class Consumable(GameObject):
+    poolable = True
+
     def __init__(self, context: GameContext, frame: Rect) -> None:
         super().__init__(context, frame)
         self.physics = PhysicsState(self)
+        self.physics.layer = Layer.CONSUMABLE
+        self.physics.mask = Layer.PLAYER
+        self.physics.blocking = False
@@ -36,10 +36,10 @@ class Frame(GameObject):
             frame.size.height / 2 - width / 2,
             frame.size.width,
             width))
-        self.ceiling.renderObject = RenderObject.render_object_from_color(context.renderer, Color(0, 0, 0, 0xFF))
-        self.wallLeft.renderObject = RenderObject.render_object_from_color(context.renderer, Color(0, 0, 0, 0xFF))
-        self.wallRight.renderObject = RenderObject.render_object_from_color(context.renderer, Color(0, 0, 0, 0xFF))
-        self.floor.renderObject = RenderObject.render_object_from_color(context.renderer, Color(0, 0, 0, 0xFF))
+        self.ceiling.renderObject = RenderObject.render_object_from_color(Color(0, 0, 0, 0xFF))
+        self.wallLeft.renderObject = RenderObject.render_object_from_color(Color(0, 0, 0, 0xFF))
+        self.wallRight.renderObject = RenderObject.render_object_from_color(Color(0, 0, 0, 0xFF))
+        self.floor.renderObject = RenderObject.render_object_from_color(Color(0, 0, 0, 0xFF))
         self.add_child(self.ceiling)
         self.add_child(self.wallLeft)
         self.add_child(self.wallRight)
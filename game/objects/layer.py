@@ -0,0 +1,4 @@
+class Layer(object):
+    SOLID = 1 << 1
+    CONSUMABLE = 1 << 2
+    PLAYER = 1 << 3
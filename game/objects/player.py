@@ -5,11 +5,13 @@ import sdl2
 from core.rect import Rect
 from core.size import Size
 from core.vector2d import Vector2D
+from core.color import Color
 from engine.animation import Animation
 from engine.context import GameContext
 from engine.gameobject import GameObject
+from engine.particles import ParticleEmitter
 from engine.physics import PhysicsState, Collision
-from game.objects.consumable import Consumable
+from game.objects.layer import Layer
 from game.objects.ui.bar import Bar
 from game.objects.ui.text import Text
 
@@ -18,6 +20,7 @@ class Player(GameObject):
     speed: float
     jumpSpeed: float
     power: int
+    winPower: int
     jumped: bool
     originalSize: Size
     crouched: bool
@@ -33,12 +36,14 @@ class Player(GameObject):
     healthBar: Optional[Bar]
     deathText: Optional[Text]
     winText: Optional[Text]
+    particles: Optional[ParticleEmitter]
 
     def __init__(self, context: GameContext, frame: Rect) -> None:
         super(Player, self).__init__(context, frame)
         self.speed = 0
         self.jumpSpeed = 0
         self.power = 0
+        self.winPower = 100
         self.jumped = False
         self.originalSize = frame.size.copy()
         self.crouched = False
@@ -50,9 +55,12 @@ class Player(GameObject):
         self.jumpAnimation = None
         self.crouchAnimation = None
         self.crouchMoveAnimation = None
+        self.particles = None
         self.physics = PhysicsState(self)
         self.physics.gravity = True
         self.physics.still = False
+        self.physics.layer = Layer.PLAYER
+        self.physics.mask = Layer.SOLID | Layer.CONSUMABLE
 
     def handle_event(self, e: sdl2.SDL_Event) -> None:
         if e.type == sdl2.SDL_KEYDOWN and e.key.keysym.sym == sdl2.SDLK_g:
@@ -127,11 +135,11 @@ class Player(GameObject):
                 self.die()
 
     def die(self) -> None:
-        self.deathText.visible = True
+        self.deathText.set_visible(True)
         self.dead = True
 
     def win(self) -> None:
-        self.winText.visible = True
+        self.winText.set_visible(True)
         self.won = True
 
     def set_crouched(self, crouched: bool) -> None:
@@ -144,21 +152,25 @@ class Player(GameObject):
             self.frame.size.height = self.originalSize.height
             self.frame.center.y -= self.frame.size.height / 2
 
-    def handle_enter_collision(self, collision: Collision) -> None:
-        if isinstance(collision.collider, Consumable):
-            self.power += 1
-            self.powerBar.set_value(self.power)
-            collision.collider.removed = True
-            self.speed += 0.01
-            self.jumpSpeed += 0.01
-            if self.power > 99:
-                self.win()
+    def collect(self, collision: Collision) -> None:
+        self.power += 1
+        self.powerBar.set_value(self.power * 100 / self.winPower)
+        collision.collider.removed = True
+        if self.particles:
+            self.particles.emit(24, 1, 30, Color(0, 0xff, 0, 0xc0), collision.collider.global_position())
+        self.speed += 0.01
+        self.jumpSpeed += 0.01
+        if self.power >= self.winPower:
+            self.win()
 
     def handle_exit_collision(self, collider: GameObject) -> None:
-        if not len(self.physics.colliders):
+        if not self.physics.contactCount:
             self.jumped = True
 
     def handle_collision(self, collision: Collision) -> None:
         if abs(collision.collision_vector.x) > abs(collision.collision_vector.y):
             if collision.collision_vector.y > 0 and self.jumped and self.physics.gravity:
                 self.jumped = False
+                if self.particles:
+                    self.particles.emit(8, 0.5, 15, Color(0x80, 0x80, 0x80, 0xc0),
+                                        self.global_position() + Vector2D(0, self.frame.size.height / 2))
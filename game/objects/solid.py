@@ -2,16 +2,18 @@ from core.rect import Rect
 from engine.context import GameContext
 from engine.gameobject import GameObject
 from engine.physics import PhysicsState, Collision
-from game.objects.player import Player
+from game.objects.layer import Layer
 
 
 class Solid(GameObject):
     def __init__(self, context: GameContext, frame: Rect) -> None:
         super().__init__(context, frame)
         self.physics = PhysicsState(self)
+        self.physics.layer = Layer.SOLID
+        self.physics.mask = Layer.PLAYER
 
-    def handle_enter_collision(self, collision: Collision) -> None:
-        if collision.collider.physics.velocity.y > 5 and isinstance(collision.collider, Player):
+    def damage_on_impact(self, collision: Collision) -> None:
+        if collision.collider.physics.velocity.y > 5:
             collision.collider.deal_damage(round(collision.collider.physics.velocity.y * 10))
 
     def handle_collision(self, collision: Collision) -> None:
@@ -1,6 +1,4 @@
 from core.rect import Rect
-from core.size import Size
-from core.vector2d import Vector2D
 from engine.context import GameContext
 from engine.gameobject import GameObject
 
@@ -21,13 +19,8 @@ class Bar(GameObject):
             new_value = 0
         self.value = new_value
 
-        self.frame = Rect(
-            Vector2D(
-                self.originalFrame.center.x + self.originalFrame.size.width * ((new_value - 100) / 200),
-                self.originalFrame.center.y
-            ),
-            Size(
-                self.originalFrame.size.width / 100 * new_value,
-                self.originalFrame.size.height
-            )
-        )
+        self.frame.center.x = self.originalFrame.center.x + self.originalFrame.size.width * ((new_value - 100) / 200)
+        self.frame.center.y = self.originalFrame.center.y
+        self.frame.size.width = self.originalFrame.size.width / 100 * new_value
+        self.frame.size.height = self.originalFrame.size.height
+        self.mark_dirty()
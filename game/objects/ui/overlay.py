@@ -0,0 +1,54 @@
+from typing import List
+
+import sdl2
+
+from core.rect import Rect
+from engine.context import GameContext
+from engine.gameobject import GameObject
+from engine.render import DrawCommand, ViewTransform, submit_draw_commands
+
+
+class Overlay(GameObject):
+    texture: sdl2.SDL_Texture
+    dirty: bool
+
+    def __init__(self, context: GameContext, frame: Rect) -> None:
+        super().__init__(context, frame)
+        self.texture = sdl2.SDL_CreateTexture(
+            context.renderer,
+            sdl2.SDL_PIXELFORMAT_RGBA8888,
+            sdl2.SDL_TEXTUREACCESS_TARGET,
+            context.settings.windowWidth,
+            context.settings.windowHeight)
+        if not self.texture:
+            raise RuntimeError("Unable to create overlay texture! SDL Error: "
+                               + str(sdl2.SDL_GetError()))
+        sdl2.SDL_SetTextureBlendMode(self.texture, sdl2.SDL_BLENDMODE_BLEND)
+        self.dirty = True
+
+    def mark_dirty(self) -> None:
+        self.dirty = True
+
+    def handle_event(self, e: sdl2.SDL_Event) -> None:
+        if e.type == sdl2.SDL_RENDER_TARGETS_RESET or e.type == sdl2.SDL_RENDER_DEVICE_RESET:
+            self.dirty = True
+        super().handle_event(e)
+
+    def take_draws(self, view: ViewTransform) -> List[DrawCommand] | None:
+        if not self.dirty:
+            return None
+        self.dirty = False
+        draws: List[DrawCommand] = list()
+        self.collect_draws(view, draws)
+        return draws
+
+    def compose(self, draws: List[DrawCommand]) -> None:
+        sdl2.SDL_SetRenderTarget(self.context.renderer, self.texture)
+        sdl2.SDL_SetRenderDrawColor(self.context.renderer, 0, 0, 0, 0)
+        sdl2.SDL_RenderClear(self.context.renderer)
+        submit_draw_commands(self.context.renderer, draws, self.context.fills)
+        sdl2.SDL_SetRenderTarget(self.context.renderer, None)
+
+    def render(self, view: ViewTransform, basis_x: float = 0, basis_y: float = 0) -> None:
+        if self.visible:
+            sdl2.SDL_RenderCopy(self.context.renderer, self.texture, None, None)
@@ -42,3 +42,4 @@ class Text(GameObject):
             surface = sdl2.sdlttf.TTF_RenderText_Solid(self.font, self.text, self.color)
             self.renderObject = RenderObject.render_object_from_surface(self.context.renderer, surface)
             sdl2.SDL_FreeSurface(surface)
+            self.mark_dirty()
@@ -1,17 +1,65 @@
+from typing import List
+
 import sdl2
 
 from core.rect import Rect
+from core.vector2d import Vector2D
 from engine.gameobject import GameObject
+from engine.physics import ContactCache, PhysicsState
+from engine.spatial import SpatialHit, SpatialIndex
 from game.objects.camera import Camera
 
 
 class World(GameObject):
+    spatial: SpatialIndex
+
     def __init__(self, context, frame: Rect) -> None:
         super(World, self).__init__(context, frame)
         self.camera = Camera(self.context, Rect(self.frame.center, self.frame.size * (1 / 2)))
+        self.spatial = SpatialIndex()
 
     def handle_event(self, e: sdl2.SDL_Event) -> None:
         super(World, self).handle_event(e)
         if e.type == sdl2.SDL_KEYDOWN:
             if e.key.keysym.sym == sdl2.SDLK_q:
                 self.context.quit = True
+
+    def add_child(self, child) -> None:
+        super(World, self).add_child(child)
+        bodies: List[PhysicsState] = list()
+        child.collect_colliders(bodies)
+        for body in bodies:
+            self.spatial.insert(body)
+
+    def clean(self) -> None:
+        for child in self.children:
+            if child.removed:
+                bodies: List[PhysicsState] = list()
+                child.collect_colliders(bodies)
+                for body in bodies:
+                    self.spatial.remove(body)
+        super(World, self).clean()
+
+    def detect_collisions(self, contacts: ContactCache) -> None:
+        super(World, self).detect_collisions(contacts)
+        self.spatial.refresh()
+
+    def query_region(self, region: Rect, mask: int = 0xffffffff) -> List[SpatialHit]:
+        return self.spatial.region(
+            region.center.x - region.size.width / 2,
+            region.center.y - region.size.height / 2,
+            region.center.x + region.size.width / 2,
+            region.center.y + region.size.height / 2,
+            mask)
+
+    def query_point(self, point: Vector2D, mask: int = 0xffffffff) -> List[SpatialHit]:
+        return self.spatial.point(point.x, point.y, mask)
+
+    def raycast(
+            self,
+            origin: Vector2D,
+            direction: Vector2D,
+            max_distance: float,
+            mask: int = 0xffffffff
+    ) -> List[SpatialHit]:
+        return self.spatial.raycast(origin, direction, max_distance, mask)
@@ -0,0 +1,23 @@
+class Scenario(object):
+    speed: float
+    jumpSpeed: float
+    gravityForce: float
+    count: int
+    powerCount: int
+    seed: int | None
+
+    def __init__(
+            self,
+            speed: float = 1.3,
+            jump_speed: float = 2.5,
+            gravity_force: float = 0.1,
+            count: int = 200,
+            power_count: int = 100,
+            seed: int | None = None
+    ) -> None:
+        self.speed = speed
+        self.jumpSpeed = jump_speed
+        self.gravityForce = gravity_force
+        self.count = count
+        self.powerCount = power_count
+        self.seed = seed
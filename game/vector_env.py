@@ -0,0 +1,208 @@
+import math
+import time
+from typing import Tuple
+
+import numpy
+
+from game.scenario import Scenario
+
+EMPTY = 0
+SOLID = 1
+CONSUMABLE = 2
+
+ACTION_MOVES = numpy.array([0, -1, 1, 0, -1, 1], dtype=numpy.float64)
+ACTION_JUMPS = numpy.array([False, False, False, True, True, True])
+
+
+class VectorEnv(object):
+    tileSize: float = 10
+    worldWidth: float = 400
+    worldHeight: float = 300
+    playerWidth: float = 10
+    playerHeight: float = 20
+    spawnX: float = 0
+    spawnY: float = 20
+    size: int
+    scenario: Scenario
+    maxSteps: int
+    viewRadius: int
+    winPower: int
+    padding: int
+    columns: int
+    rows: int
+    rng: numpy.random.Generator
+    freeCells: numpy.ndarray
+    tiles: numpy.ndarray
+    x: numpy.ndarray
+    y: numpy.ndarray
+    vy: numpy.ndarray
+    speed: numpy.ndarray
+    jumpSpeed: numpy.ndarray
+    health: numpy.ndarray
+    power: numpy.ndarray
+    jumped: numpy.ndarray
+    steps: numpy.ndarray
+
+    def __init__(self, size: int, scenario: Scenario | None = None, max_steps: int = 10000, view_radius: int = 3):
+        self.size = size
+        self.scenario = scenario or Scenario()
+        self.maxSteps = max_steps
+        self.viewRadius = view_radius
+        self.winPower = max(1, min(self.scenario.powerCount, self.scenario.count))
+        self.padding = max(view_radius, 1)
+        self.columns = int(self.worldWidth / self.tileSize - 2)
+        self.rows = int(self.worldHeight / self.tileSize - 2)
+        self.rng = numpy.random.default_rng(self.scenario.seed)
+
+        spawn = numpy.zeros((self.rows, self.columns), dtype=bool)
+        spawn_x, spawn_y = self.to_local(self.spawnX, self.spawnY)
+        spawn[int((spawn_y - self.playerHeight / 2) // self.tileSize):
+              math.ceil((spawn_y + self.playerHeight / 2) / self.tileSize),
+              int((spawn_x - self.playerWidth / 2) // self.tileSize):
+              math.ceil((spawn_x + self.playerWidth / 2) / self.tileSize)] = True
+        self.freeCells = numpy.flatnonzero(~spawn)
+
+        self.tiles = numpy.full(
+            (size, self.rows + 2 * self.padding, self.columns + 2 * self.padding), SOLID, dtype=numpy.int8)
+        self.x = numpy.zeros(size)
+        self.y = numpy.zeros(size)
+        self.vy = numpy.zeros(size)
+        self.speed = numpy.zeros(size)
+        self.jumpSpeed = numpy.zeros(size)
+        self.health = numpy.zeros(size, dtype=numpy.int64)
+        self.power = numpy.zeros(size, dtype=numpy.int64)
+        self.jumped = numpy.zeros(size, dtype=bool)
+        self.steps = numpy.zeros(size, dtype=numpy.int64)
+        self.reset()
+
+    def to_local(self, x: float, y: float) -> Tuple[float, float]:
+        return x + self.worldWidth / 2 - self.tileSize, y + self.worldHeight / 2 - self.tileSize
+
+    def reset(self, mask: numpy.ndarray | None = None) -> numpy.ndarray:
+        worlds = numpy.arange(self.size) if mask is None else numpy.flatnonzero(mask)
+        count = len(worlds)
+        if count:
+            order = numpy.argsort(self.rng.random((count, len(self.freeCells))), axis=1)
+            cells = self.freeCells[order[:, :self.scenario.count]]
+            power_count = min(self.scenario.powerCount, self.scenario.count)
+            interior = numpy.zeros((count, self.rows * self.columns), dtype=numpy.int8)
+            index = numpy.arange(count)[:, None]
+            interior[index, cells[:, :power_count]] = CONSUMABLE
+            interior[index, cells[:, power_count:]] = SOLID
+            p = self.padding
+            self.tiles[worlds, p:p + self.rows, p:p + self.columns] = interior.reshape(count, self.rows, self.columns)
+
+            spawn_x, spawn_y = self.to_local(self.spawnX, self.spawnY)
+            self.x[worlds] = spawn_x
+            self.y[worlds] = spawn_y
+            self.vy[worlds] = 0
+            self.speed[worlds] = self.scenario.speed
+            self.jumpSpeed[worlds] = self.scenario.jumpSpeed
+            self.health[worlds] = 100
+            self.power[worlds] = 0
+            self.jumped[worlds] = False
+            self.steps[worlds] = 0
+        return self.observe()
+
+    def collide(self) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        half_width = self.playerWidth / 2
+        half_height = self.playerHeight / 2
+        first_column = numpy.floor((self.x - half_width) / self.tileSize).astype(numpy.intp)
+        last_column = numpy.ceil((self.x + half_width) / self.tileSize).astype(numpy.intp) - 1
+        first_row = numpy.floor((self.y - half_height) / self.tileSize).astype(numpy.intp)
+        last_row = numpy.ceil((self.y + half_height) / self.tileSize).astype(numpy.intp) - 1
+
+        columns = first_column[:, None] + numpy.arange(math.ceil(self.playerWidth / self.tileSize) + 1)
+        rows = first_row[:, None] + numpy.arange(math.ceil(self.playerHeight / self.tileSize) + 1)
+        valid = (rows <= last_row[:, None])[:, :, None] & (columns <= last_column[:, None])[:, None, :]
+        tile_rows = numpy.clip(rows + self.padding, 0, self.tiles.shape[1] - 1)[:, :, None]
+        tile_columns = numpy.clip(columns + self.padding, 0, self.tiles.shape[2] - 1)[:, None, :]
+        worlds = numpy.arange(self.size)[:, None, None]
+        values = self.tiles[worlds, tile_rows, tile_columns]
+
+        collected = (values == CONSUMABLE) & valid
+        if collected.any():
+            world, row, column = numpy.nonzero(collected)
+            self.tiles[world, tile_rows[world, row, 0], tile_columns[world, 0, column]] = EMPTY
+        return rows, columns, (values == SOLID) & valid, collected.sum(axis=(1, 2))
+
+    def move(self, delta: numpy.ndarray, vertical: bool) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        position = self.y if vertical else self.x
+        half = self.playerHeight / 2 if vertical else self.playerWidth / 2
+        blocked = numpy.zeros(self.size, dtype=bool)
+        pickups = numpy.zeros(self.size, dtype=numpy.int64)
+        substeps = math.ceil(numpy.abs(delta).max() / (self.tileSize / 2))
+        for _ in range(substeps):
+            active = ~blocked & (delta != 0)
+            position += numpy.where(active, delta / substeps, 0)
+            rows, columns, solid, collected = self.collide()
+            pickups += collected
+            hit = active & solid.any(axis=(1, 2))
+            if not hit.any():
+                continue
+            cells = rows if vertical else columns
+            hit_cells = solid.any(axis=2) if vertical else solid.any(axis=1)
+            nearest_forward = numpy.where(hit_cells, cells, numpy.iinfo(numpy.intp).max).min(axis=1)
+            nearest_backward = numpy.where(hit_cells, cells, numpy.iinfo(numpy.intp).min).max(axis=1)
+            forward = hit & (delta > 0)
+            backward = hit & (delta < 0)
+            position[forward] = nearest_forward[forward] * self.tileSize - half
+            position[backward] = (nearest_backward[backward] + 1) * self.tileSize + half
+            blocked |= hit
+        return blocked, pickups
+
+    def step(self, actions: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+        actions = numpy.asarray(actions)
+        jump = ACTION_JUMPS[actions] & ~self.jumped
+        self.vy -= numpy.where(jump, self.jumpSpeed, 0)
+        self.jumped |= jump
+
+        _, pickups = self.move(ACTION_MOVES[actions] * self.speed, False)
+
+        self.vy += self.scenario.gravityForce
+        blocked, vertical_pickups = self.move(self.vy.copy(), True)
+        pickups += vertical_pickups
+
+        landed = blocked & (self.vy > 0)
+        damage = numpy.where(landed & (self.vy > 5), numpy.rint(self.vy * 10), 0).astype(numpy.int64)
+        self.vy[blocked] = 0
+        self.jumped = ~landed
+
+        self.health -= damage
+        self.power += pickups
+        self.speed += pickups * 0.01
+        self.jumpSpeed += pickups * 0.01
+        self.steps += 1
+
+        rewards = (pickups - damage / 100).astype(numpy.float32)
+        dones = (self.power >= self.winPower) | (self.health < 0) | (self.steps >= self.maxSteps)
+        if dones.any():
+            return self.reset(dones), rewards, dones
+        return self.observe(), rewards, dones
+
+    def observe(self) -> numpy.ndarray:
+        offsets = numpy.arange(-self.viewRadius, self.viewRadius + 1) + self.padding
+        rows = numpy.floor(self.y / self.tileSize).astype(numpy.intp)[:, None] + offsets
+        columns = numpy.floor(self.x / self.tileSize).astype(numpy.intp)[:, None] + offsets
+        view = self.tiles[numpy.arange(self.size)[:, None, None], rows[:, :, None], columns[:, None, :]]
+        state = numpy.stack((
+            self.x / (self.columns * self.tileSize),
+            self.y / (self.rows * self.tileSize),
+            self.vy / 10,
+            self.health / 100,
+            self.power / self.winPower,
+            self.jumped,
+        ), axis=1)
+        return numpy.concatenate((state, view.reshape(self.size, -1)), axis=1).astype(numpy.float32)
+
+
+if __name__ == '__main__':
+    env = VectorEnv(256, Scenario(seed=0))
+    rng = numpy.random.default_rng(0)
+    total_steps = 1000
+    start = time.perf_counter()
+    for _ in range(total_steps):
+        env.step(rng.integers(0, len(ACTION_MOVES), env.size))
+    elapsed = time.perf_counter() - start
+    print("%d worlds: %.0f steps/s, %.0f world steps/s" % (
+        env.size, total_steps / elapsed, total_steps * env.size / elapsed))
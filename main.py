@@ -1,4 +1,20 @@
+import argparse
+
+from engine.recorder import ChunkedFrameWriter, PngFrameWriter
 from game.game import Game
 
 if __name__ == '__main__':
-    Game().run()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pipelined", action="store_true")
+    parser.add_argument("--record-png", metavar="DIRECTORY")
+    parser.add_argument("--record-chunks", metavar="FILE")
+    arguments = parser.parse_args()
+    game = Game()
+    if arguments.record_png:
+        game.start_recording(PngFrameWriter(arguments.record_png))
+    elif arguments.record_chunks:
+        game.start_recording(ChunkedFrameWriter(arguments.record_chunks))
+    if arguments.pipelined:
+        game.run_pipelined()
+    else:
+        game.run()
@@ -0,0 +1,122 @@
+import pytest
+
+from core.rect import Rect
+from engine.gameobject import GameObject
+from engine.physics import PhysicsState
+
+
+def make_body(x: float, y: float, width: float, height: float, still: bool = True) -> PhysicsState:
+    game_object = GameObject(None, Rect.make(x, y, width, height))
+    game_object.physics = PhysicsState(game_object)
+    game_object.physics.still = still
+    return game_object.physics
+
+
+def fall(body: PhysicsState, speed: float) -> None:
+    body.velocity.y = speed
+    body.change()
+
+
+def test_time_of_impact_reports_entry_along_motion():
+    player = make_body(0, 60, 10, 20, still=False)
+    brick = make_body(0, 100, 10, 10)
+    fall(player, 40)
+
+    entry, exit_time, x_axis = player.time_of_impact(brick)
+
+    assert entry == pytest.approx(25 / 40)
+    assert exit_time > 1
+    assert not x_axis
+
+
+def test_time_of_impact_ignores_miss_and_static_bodies():
+    player = make_body(0, 60, 10, 20, still=False)
+    brick = make_body(50, 100, 10, 10)
+    assert player.time_of_impact(brick) is None
+
+    fall(player, 40)
+    assert player.time_of_impact(brick) is None
+
+
+@pytest.mark.parametrize("speed", [30, 40, 50, 54, 60, 200])
+def test_sweep_stops_fast_body_on_top_of_collider(speed):
+    player = make_body(0, 60, 10, 20, still=False)
+    brick = make_body(0, 100, 10, 10)
+    fall(player, speed)
+
+    player.sweep([player, brick])
+
+    assert player.game_object.frame.center.y == pytest.approx(85 + player.contactSkin)
+
+
+def test_sweep_picks_earliest_blocking_collider():
+    player = make_body(0, 60, 10, 20, still=False)
+    near = make_body(0, 100, 10, 10)
+    far = make_body(0, 130, 10, 10)
+    fall(player, 100)
+
+    player.sweep([far, near])
+
+    assert player.game_object.frame.center.y == pytest.approx(85 + player.contactSkin)
+
+
+def test_sweep_passes_through_non_blocking_colliders():
+    player = make_body(0, 60, 10, 20, still=False)
+    pickup = make_body(0, 80, 10, 10)
+    pickup.blocking = False
+    brick = make_body(0, 200, 10, 10)
+    fall(player, 60)
+
+    player.sweep([pickup, brick])
+
+    assert player.game_object.frame.center.y == 120
+
+
+def test_sweep_respects_layer_masks():
+    player = make_body(0, 60, 10, 20, still=False)
+    player.mask = 2
+    brick = make_body(0, 100, 10, 10)
+    fall(player, 60)
+
+    player.sweep([brick])
+
+    assert player.game_object.frame.center.y == 120
+
+
+def test_sweep_keeps_sliding_motion_on_a_floor():
+    body = make_body(0, 85, 10, 20, still=False)
+    floor = make_body(0, 100, 200, 10)
+    body.velocity.x = 30
+    body.velocity.y = 0.1
+    body.change()
+
+    body.sweep([floor])
+
+    assert body.game_object.frame.center.x == 30
+    assert body.game_object.frame.center.y == pytest.approx(85 + body.contactSkin)
+
+
+def test_sweep_keeps_falling_motion_along_a_wall():
+    body = make_body(0, 0, 10, 20, still=False)
+    wall = make_body(20, 0, 10, 200)
+    body.velocity.x = 15
+    body.velocity.y = 8
+    body.change()
+
+    body.sweep([wall])
+
+    assert body.game_object.frame.center.x == pytest.approx(10 + body.contactSkin)
+    assert body.game_object.frame.center.y == 8
+
+
+def test_sweep_stops_diagonal_body_on_the_first_surface_hit():
+    body = make_body(0, 60, 10, 20, still=False)
+    brick = make_body(0, 100, 10, 10)
+    body.velocity.x = 4
+    body.velocity.y = 50
+    body.change()
+
+    body.sweep([brick])
+
+    assert body.game_object.frame.center.x == 4
+    assert body.game_object.frame.center.y == pytest.approx(85 + body.contactSkin)
@@ -0,0 +1,160 @@
+import math
+
+import pytest
+
+from core.rect import Rect
+from core.vector2d import Vector2D
+from engine.gameobject import GameObject
+from engine.physics import PhysicsState
+from engine.pool import ObjectPool
+from engine.spatial import SpatialIndex
+from game.objects.consumable import Consumable
+from game.objects.layer import Layer
+from game.objects.world import World
+
+
+def make_body(x: float, y: float, width: float, height: float, layer: int = 1) -> PhysicsState:
+    game_object = GameObject(None, Rect.make(x, y, width, height))
+    game_object.physics = PhysicsState(game_object)
+    game_object.physics.layer = layer
+    return game_object.physics
+
+
+def make_index(*bodies: PhysicsState) -> SpatialIndex:
+    index = SpatialIndex()
+    for body in bodies:
+        index.insert(body)
+    return index
+
+
+def test_region_returns_overlapping_bodies_nearest_first():
+    near = make_body(10, 10, 10, 10)
+    far = make_body(45, 10, 10, 10)
+    outside = make_body(200, 200, 10, 10)
+    index = make_index(near, far, outside)
+
+    hits = index.region(0, 0, 50, 20)
+
+    assert [hit.body for hit in hits] == [near, far]
+    assert hits[0].distance == pytest.approx(15)
+
+
+def test_region_excludes_touching_edges_and_masked_layers():
+    touching = make_body(25, 10, 10, 10)
+    masked = make_body(10, 10, 10, 10, layer=2)
+    index = make_index(touching, masked)
+
+    assert index.region(0, 0, 20, 20, mask=1) == []
+    assert [hit.body for hit in index.region(0, 0, 20, 20)] == [masked]
+
+
+def test_point_finds_bodies_containing_point():
+    body = make_body(10, 10, 10, 10)
+    other = make_body(30, 10, 10, 10)
+    index = make_index(body, other)
+
+    assert [hit.body for hit in index.point(12, 8)] == [body]
+    assert index.point(20, 20) == []
+    assert index.point(-100, -100) == []
+
+
+def test_point_skips_removed_bodies():
+    body = make_body(10, 10, 10, 10)
+    index = make_index(body)
+    body.game_object.removed = True
+
+    assert index.point(10, 10) == []
+
+
+def test_raycast_orders_hits_by_entry_distance():
+    first = make_body(50, 10, 10, 10)
+    second = make_body(100, 10, 10, 10)
+    off_ray = make_body(75, 60, 10, 10)
+    index = make_index(second, first, off_ray)
+
+    hits = index.raycast(Vector2D(0, 10), Vector2D(2, 0), 200)
+
+    assert [hit.body for hit in hits] == [first, second]
+    assert [hit.distance for hit in hits] == [pytest.approx(45), pytest.approx(95)]
+
+
+def test_raycast_stops_at_max_distance():
+    first = make_body(50, 10, 10, 10)
+    second = make_body(100, 10, 10, 10)
+    index = make_index(first, second)
+
+    assert [hit.body for hit in index.raycast(Vector2D(0, 10), Vector2D(1, 0), 60)] == [first]
+    assert index.raycast(Vector2D(0, 10), Vector2D(1, 0), 40) == []
+
+
+def test_raycast_from_outside_the_index():
+    first = make_body(50, 10, 10, 10)
+    second = make_body(100, 10, 10, 10)
+    index = make_index(first, second)
+
+    hits = index.raycast(Vector2D(-1000, 10), Vector2D(1, 0), 1100)
+
+    assert [hit.body for hit in hits] == [first, second]
+    assert hits[0].distance == pytest.approx(1045)
+
+
+def test_raycast_from_outside_pointing_away_misses():
+    index = make_index(make_body(50, 10, 10, 10))
+
+    assert index.raycast(Vector2D(-1000, 10), Vector2D(-1, 0), math.inf) == []
+    assert index.raycast(Vector2D(-1000, 500), Vector2D(1, 0), math.inf) == []
+
+
+def test_raycast_with_infinite_max_distance():
+    first = make_body(50, 50, 10, 10)
+    second = make_body(300, 300, 10, 10)
+    index = make_index(first, second)
+
+    hits = index.raycast(Vector2D(-500, -500), Vector2D(1, 1), math.inf)
+
+    assert [hit.body for hit in hits] == [first, second]
+    assert hits[0].distance == pytest.approx(545 * math.sqrt(2))
+    assert len(index.ray_cells(Vector2D(-500, -500), Vector2D(1, 1) * (1 / math.sqrt(2)), math.inf)) < 50
+
+
+def test_raycast_with_zero_direction_queries_origin():
+    body = make_body(10, 10, 10, 10)
+    index = make_index(body)
+
+    assert [hit.body for hit in index.raycast(Vector2D(10, 10), Vector2D(), 100)] == [body]
+
+
+def test_update_moves_body_between_cells():
+    body = make_body(10, 10, 10, 10)
+    index = make_index(body)
+    body.game_object.frame.center.x = 110
+
+    index.update(body)
+
+    assert index.point(10, 10) == []
+    assert [hit.body for hit in index.point(110, 10)] == [body]
+
+
+def test_world_clean_removes_bodies_and_pooled_objects_come_back_indexed():
+    world = World(None, Rect.make(0, 0, 400, 400))
+    pool = ObjectPool()
+    consumable = pool.acquire(Consumable, None, Rect.make(50, 50, 10, 10))
+    world.add_child(consumable)
+    assert [hit.body for hit in world.query_point(Vector2D(50, 50), Layer.CONSUMABLE)] == [consumable.physics]
+
+    consumable.removed = True
+    world.clean()
+    pool.recycle()
+
+    assert world.query_point(Vector2D(50, 50)) == []
+    assert consumable.physics not in world.spatial.ranges
+    assert pool.in_use(Consumable) == 0
+
+    reused = pool.acquire(Consumable, None, Rect.make(150, 50, 10, 10))
+    world.add_child(reused)
+
+    assert reused is consumable
+    assert world.query_point(Vector2D(50, 50)) == []
+    assert [hit.body for hit in world.query_point(Vector2D(150, 50))] == [reused.physics]
+    assert [hit.body for hit in world.query_region(Rect.make(100, 50, 200, 20))] == [reused.physics]
+    assert [hit.body for hit in world.raycast(Vector2D(-100, 50), Vector2D(1, 0), math.inf)] == [reused.physics]